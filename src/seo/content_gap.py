@@ -17,6 +17,20 @@ import requests
 from urllib.parse import urlparse, urljoin
 from collections import defaultdict, Counter
 import hashlib
+import heapq
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(obj) -> str:
+    """Serialize obj to a compact JSON string, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
 
 class ContentType(Enum):
     BLOG_POST = "blog_post"
@@ -153,6 +167,12 @@ class ContentGapAnalyzer:
                 self.strategy = json.load(f)
         else:
             self.strategy = {}
+        
+        # Precompute cluster keyword sets for fast membership tests
+        self._cluster_sets = {
+            cluster_key: (cluster_data['main_topic'], frozenset(cluster_data.get('keywords', [])))
+            for cluster_key, cluster_data in self.strategy.get('clusters', {}).items()
+        }
     
     def extract_keywords_from_content(self, text: str, title: str = "") -> List[str]:
         """Extract relevant keywords from content text"""
@@ -217,12 +237,11 @@ class ContentGapAnalyzer:
         keywords = self.extract_keywords_from_content(content, title)
         
         # Determine topic clusters
-        topic_clusters = []
-        if 'clusters' in self.strategy:
-            for cluster_key, cluster_data in self.strategy['clusters'].items():
-                cluster_keywords = cluster_data.get('keywords', [])
-                if any(kw in keywords for kw in cluster_keywords):
-                    topic_clusters.append(cluster_data['main_topic'])
+        keyword_set = set(keywords)
+        topic_clusters = [
+            main_topic for main_topic, cluster_keywords in self._cluster_sets.values()
+            if not cluster_keywords.isdisjoint(keyword_set)
+        ]
         
         piece = ContentPiece(
             url=url,
@@ -257,8 +276,8 @@ class ContentGapAnalyzer:
             content_piece.title,
             content_piece.content_type.value,
             content_piece.word_count,
-            json.dumps(content_piece.keywords),
-            json.dumps(content_piece.topic_clusters),
+            _json_dumps(content_piece.keywords),
+            _json_dumps(content_piece.topic_clusters),
             content_piece.performance_score,
             content_hash
         ))
@@ -278,6 +297,34 @@ class ContentGapAnalyzer:
         conn.commit()
         conn.close()
     
+    def add_content_batch(self, content_pieces: List[ContentPiece]):
+        """Add multiple content pieces, then refresh query planner statistics"""
+        for content_piece in content_pieces:
+            self.add_content_to_inventory(content_piece)
+        
+        self.optimize()
+    
+    def optimize(self):
+        """Refresh SQLite planner statistics after bulk ingestion.
+        
+        Call this after large imports (>1000 pieces) before running gap analysis.
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        )
+        if cursor.fetchone() is None:
+            # First ingest: no statistics yet, build them in full
+            cursor.execute("ANALYZE content_pieces")
+            cursor.execute("ANALYZE keyword_coverage")
+        else:
+            cursor.execute("PRAGMA optimize")
+        
+        conn.commit()
+        conn.close()
+    
     def get_keyword_coverage(self, keyword: str) -> List[Tuple[ContentPiece, float]]:
         """Get all content covering a specific keyword with strength scores"""
         coverage = []
@@ -469,12 +516,11 @@ class ContentGapAnalyzer:
         """Generate a content calendar based on identified gaps"""
         calendar = defaultdict(list)
         
-        # Sort gaps by opportunity score and select top ones
-        priority_gaps = sorted(gaps, key=lambda x: x.opportunity_score, reverse=True)
+        # Select top gaps by opportunity score (2 pieces per week max)
+        priority_gaps = heapq.nlargest(weeks * 2, gaps, key=lambda x: x.opportunity_score)
         
         # Distribute content across weeks
-        week = 0
-        for i, gap in enumerate(priority_gaps[:weeks * 2]):  # 2 pieces per week max
+        for i, gap in enumerate(priority_gaps):
             week_key = f"week_{(i // 2) + 1}"
             
             calendar_entry = {
@@ -523,7 +569,7 @@ class ContentGapAnalyzer:
                     'content_angle': gap.content_angle,
                     'target_funnel_stage': gap.target_funnel_stage
                 }
-                for gap in gaps[:50]  # Top 50 gaps
+                for gap in gaps[:50]  # Top 50 gaps; identify_content_gaps returns them best first
             ],
             'content_calendar': content_calendar,
             'keyword_coverage': keyword_coverage_summary,
@@ -537,8 +583,12 @@ class ContentGapAnalyzer:
         }
         
         output_path = self.data_dir / filename
-        with open(output_path, 'w') as f:
-            json.dump(analysis_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(analysis_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(analysis_data, f, indent=2)
         
         return output_path
     
@@ -565,11 +615,13 @@ class ContentGapAnalyzer:
             }
         ]
         
-        for item in sample_content:
-            content_piece = self.analyze_content_piece(
+        content_pieces = [
+            self.analyze_content_piece(
                 item['url'], item['title'], item['content'], item['type']
             )
-            self.add_content_to_inventory(content_piece)
+            for item in sample_content
+        ]
+        self.add_content_batch(content_pieces)
 
 if __name__ == "__main__":
     analyzer = ContentGapAnalyzer()
@@ -8,12 +8,76 @@ Includes search volume estimation, difficulty scoring, and keyword generation.
 
 import json
 import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from enum import Enum
 import sqlite3
 from pathlib import Path
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Search intent patterns, each list compiled into one alternation so a
+# keyword is scanned once per intent instead of once per pattern
+INFO_INTENT_PATTERNS = ("how to", "what is", "why", "guide", "tips", "help")
+TRANS_INTENT_PATTERNS = ("buy", "purchase", "order", "hire", "book", "schedule")
+COMMERCIAL_INTENT_PATTERNS = ("best", "top", "review", "compare", "vs", "cost", "price")
+
+_INFO_INTENT_RE = re.compile('|'.join(map(re.escape, INFO_INTENT_PATTERNS)))
+_TRANS_INTENT_RE = re.compile('|'.join(map(re.escape, TRANS_INTENT_PATTERNS)))
+_COMMERCIAL_INTENT_RE = re.compile('|'.join(map(re.escape, COMMERCIAL_INTENT_PATTERNS)))
+
+# Scalar keyword columns, in Keyword field order; term lists are stored
+# one row per term in the keyword_related table
+KEYWORD_COLUMNS = (
+    "term", "search_volume", "difficulty", "intent", "category", "subcategory",
+    "cpc", "competition", "trending_score"
+)
+_RELATED_KIND = "related"
+_QUESTION_KIND = "question"
+
+# Topics that double the estimated search volume
+HIGH_VOLUME_TERMS = ("caregiver", "caregiving", "dementia", "alzheimer")
+_HIGH_VOLUME_RE = re.compile('|'.join(HIGH_VOLUME_TERMS), re.IGNORECASE)
+
+# Long-tail and question patterns; {0} is the seed keyword or topic
+_LONGTAIL_TEMPLATES = (
+    "how to {0}",
+    "best {0}",
+    "{0} tips",
+    "{0} guide",
+    "{0} for beginners",
+    "{0} checklist",
+    "{0} resources",
+    "{0} support",
+    "{0} help",
+    "what is {0}",
+    "signs of {0}",
+    "dealing with {0}",
+    "{0} at home",
+    "{0} for seniors",
+    "affordable {0}"
+)
+
+_QUESTION_TEMPLATES = (
+    "How to {0}",
+    "What is {0}",
+    "Why does {0}",
+    "When to {0}",
+    "Where to find {0}",
+    "Who can help with {0}",
+    "How much does {0} cost",
+    "Is {0} covered by insurance",
+    "What are signs of {0}",
+    "How long does {0} take"
+)
+
 class KeywordDifficulty(Enum):
     """Keyword difficulty levels"""
     VERY_EASY = 1
@@ -29,6 +93,10 @@ class KeywordIntent(Enum):
     TRANSACTIONAL = "transactional"
     COMMERCIAL = "commercial"
 
+# Plain dict lookups for turning stored values back into enum members
+_DIFF_BY_VALUE = {e.value: e for e in KeywordDifficulty}
+_INTENT_BY_VALUE = {e.value: e for e in KeywordIntent}
+
 @dataclass
 class Keyword:
     """Keyword data structure"""
@@ -41,14 +109,31 @@ class Keyword:
     cpc: float = 0.0
     competition: float = 0.0
     trending_score: float = 0.0
-    related_terms: List[str] = None
-    questions: List[str] = None
+    related_terms: List[str] = field(default_factory=list)
+    questions: List[str] = field(default_factory=list)
+
+def _build_row_function(columns: Tuple[str, ...]):
+    """Generate a function returning a Keyword's column values as one tuple
     
-    def __post_init__(self):
-        if self.related_terms is None:
-            self.related_terms = []
-        if self.questions is None:
-            self.questions = []
+    The body is compiled for the exact column list, so building a row is a
+    straight run of attribute loads and always matches the INSERT statement.
+    """
+    values = ", ".join(
+        f"keyword.{column}.value" if column in ("difficulty", "intent") else f"keyword.{column}"
+        for column in columns
+    )
+    namespace = {}
+    exec(f"def keyword_row(keyword):\n    return ({values},)", namespace)
+    return namespace["keyword_row"]
+
+# Convert a Keyword into a row for the keywords table
+_keyword_to_row = _build_row_function(KEYWORD_COLUMNS)
+
+@lru_cache(maxsize=1)
+def _load_seo_keywords_json(path: str) -> Dict:
+    """Parse the keyword config once per path; the result is shared, so treat it as read-only"""
+    with open(path) as f:
+        return json.load(f)
 
 class KeywordResearcher:
     """Main keyword research and analysis tool"""
@@ -57,6 +142,28 @@ class KeywordResearcher:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.db_path = self.data_dir / "keywords.db"
+        
+        # One connection for the researcher's lifetime; call close() when done
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")  # 64 MB
+        
+        # Kept as strings so sqlite3's statement cache reuses the prepared forms.
+        # An upsert rather than INSERT OR REPLACE keeps ids stable and fires the
+        # update trigger that keeps the full-text index in sync.
+        self._insert_sql = f'''
+            INSERT INTO keywords ({", ".join(KEYWORD_COLUMNS)})
+            VALUES ({", ".join("?" * len(KEYWORD_COLUMNS))})
+            ON CONFLICT(term) DO UPDATE SET
+                {", ".join(f"{column} = excluded.{column}" for column in KEYWORD_COLUMNS[1:])},
+                updated_at = CURRENT_TIMESTAMP
+        '''
+        self._insert_related_sql = '''
+            INSERT INTO keyword_related (keyword_id, kind, position, term)
+            SELECT id, ?, ?, ? FROM keywords WHERE term = ?
+        '''
+        
         self.init_database()
         
         # Load keyword seeds and patterns
@@ -64,8 +171,10 @@ class KeywordResearcher:
     
     def init_database(self):
         """Initialize SQLite database for keyword storage"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        
+        # WAL persists in the database file; other pragmas are set per connection
+        cursor.execute("PRAGMA journal_mode=WAL")
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS keywords (
@@ -94,15 +203,104 @@ class KeywordResearcher:
             CREATE INDEX IF NOT EXISTS idx_keywords_difficulty ON keywords(difficulty);
         ''')
         
-        conn.commit()
-        conn.close()
+        # Serves both the category lookup and its volume ordering without a sort
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_keywords_cat_vol ON keywords(category, search_volume DESC);
+        ''')
+        
+        # Related terms and questions, one row per term
+        has_related_table = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'keyword_related'"
+        ).fetchone() is not None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS keyword_related (
+                keyword_id INTEGER,
+                kind TEXT,
+                position INTEGER,
+                term TEXT
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_keyword_related_keyword ON keyword_related(keyword_id, kind, position);
+        ''')
+        
+        if not has_related_table:
+            self._migrate_json_terms(cursor)
+        
+        self.init_search_index(cursor)
+        
+        self._conn.commit()
+    
+    def init_search_index(self, cursor: sqlite3.Cursor):
+        """Create the FTS5 index over keyword terms, if SQLite was built with FTS5"""
+        has_fts_table = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'keywords_fts'"
+        ).fetchone() is not None
+        
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS keywords_fts
+                USING fts5(term, category, content='keywords', content_rowid='id')
+            ''')
+        except sqlite3.OperationalError:
+            self.fts_available = False
+            return
+        self.fts_available = True
+        
+        # External-content table: triggers mirror every change to keywords
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS keywords_ai AFTER INSERT ON keywords BEGIN
+                INSERT INTO keywords_fts(rowid, term, category) VALUES (new.id, new.term, new.category);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS keywords_ad AFTER DELETE ON keywords BEGIN
+                INSERT INTO keywords_fts(keywords_fts, rowid, term, category)
+                VALUES ('delete', old.id, old.term, old.category);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS keywords_au AFTER UPDATE OF term, category ON keywords BEGIN
+                INSERT INTO keywords_fts(keywords_fts, rowid, term, category)
+                VALUES ('delete', old.id, old.term, old.category);
+                INSERT INTO keywords_fts(rowid, term, category) VALUES (new.id, new.term, new.category);
+            END
+        ''')
+        
+        # Index keywords that were stored before the index existed
+        if not has_fts_table:
+            cursor.execute("INSERT INTO keywords_fts(keywords_fts) VALUES ('rebuild')")
+    
+    def _migrate_json_terms(self, cursor: sqlite3.Cursor):
+        """Move term lists that older databases stored as JSON text into keyword_related"""
+        rows = cursor.execute('''
+            SELECT id, related_terms, questions FROM keywords
+            WHERE related_terms IS NOT NULL OR questions IS NOT NULL
+        ''').fetchall()
+        
+        cursor.executemany('''
+            INSERT INTO keyword_related (keyword_id, kind, position, term) VALUES (?, ?, ?, ?)
+        ''', (
+            (keyword_id, kind, position, term)
+            for keyword_id, related_terms, questions in rows
+            for kind, terms in ((_RELATED_KIND, related_terms), (_QUESTION_KIND, questions))
+            for position, term in enumerate(json.loads(terms) if terms else [])
+        ))
+        
+        cursor.execute('UPDATE keywords SET related_terms = NULL, questions = NULL')
+    
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
     
     def load_keyword_config(self):
         """Load keyword configuration and seed data"""
         config_path = Path("config/seo_keywords.json")
         if config_path.exists():
-            with open(config_path) as f:
-                self.config = json.load(f)
+            # Keyed by absolute path so a changed working directory is not served stale data
+            self.config = _load_seo_keywords_json(str(config_path.resolve()))
         else:
             # Default configuration if file doesn't exist
             self.config = self.generate_default_config()
@@ -141,44 +339,18 @@ class KeywordResearcher:
     
     def generate_longtail_keywords(self, seed_keyword: str, variations: int = 10) -> List[str]:
         """Generate long-tail keyword variations"""
-        patterns = [
-            f"how to {seed_keyword}",
-            f"best {seed_keyword}",
-            f"{seed_keyword} tips",
-            f"{seed_keyword} guide",
-            f"{seed_keyword} for beginners",
-            f"{seed_keyword} checklist",
-            f"{seed_keyword} resources",
-            f"{seed_keyword} support",
-            f"{seed_keyword} help",
-            f"what is {seed_keyword}",
-            f"signs of {seed_keyword}",
-            f"dealing with {seed_keyword}",
-            f"{seed_keyword} at home",
-            f"{seed_keyword} for seniors",
-            f"affordable {seed_keyword}"
-        ]
-        
-        return patterns[:variations]
+        return [template.format(seed_keyword) for template in _LONGTAIL_TEMPLATES[:variations]]
     
-    def generate_question_keywords(self, topic: str) -> List[str]:
+    def generate_question_keywords(self, topic: str, variations: int = 10) -> List[str]:
         """Generate question-based keywords"""
-        question_starters = [
-            f"How to {topic}",
-            f"What is {topic}",
-            f"Why does {topic}",
-            f"When to {topic}",
-            f"Where to find {topic}",
-            f"Who can help with {topic}",
-            f"How much does {topic} cost",
-            f"Is {topic} covered by insurance",
-            f"What are signs of {topic}",
-            f"How long does {topic} take"
-        ]
-        
-        return question_starters
+        return [template.format(topic) for template in _QUESTION_TEMPLATES[:variations]]
+    
+    # The three scoring methods below are pure functions of the keyword, and
+    # research generates many repeated terms, so their results are memoized
     
-    def estimate_search_volume(self, keyword: str) -> int:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def estimate_search_volume(keyword: str) -> int:
         """Estimate search volume based on keyword characteristics"""
         # This is a simplified estimation model
         # In production, you'd use Google Keyword Planner API or similar
@@ -186,7 +358,7 @@ class KeywordResearcher:
         base_volume = 1000
         
         # Adjust based on keyword length
-        word_count = len(keyword.split())
+        word_count = keyword.count(' ') + 1
         if word_count == 1:
             multiplier = 5.0
         elif word_count == 2:
@@ -197,15 +369,34 @@ class KeywordResearcher:
             multiplier = 0.5
         
         # Adjust based on keyword category
-        high_volume_terms = ["caregiver", "caregiving", "dementia", "alzheimer"]
-        if any(term in keyword.lower() for term in high_volume_terms):
+        if _HIGH_VOLUME_RE.search(keyword):
             multiplier *= 2
         
         return int(base_volume * multiplier)
     
-    def calculate_keyword_difficulty(self, keyword: str) -> KeywordDifficulty:
+    def estimate_search_volumes(self, keywords: List[str]) -> List[int]:
+        """Estimate search volume for a batch of keywords at once"""
+        if not NUMPY_AVAILABLE:
+            return [self.estimate_search_volume(keyword) for keyword in keywords]
+        
+        count = len(keywords)
+        word_counts = np.fromiter((k.count(' ') + 1 for k in keywords), dtype=np.int64, count=count)
+        multipliers = np.select(
+            [word_counts == 1, word_counts == 2, word_counts == 3],
+            [5.0, 3.0, 1.5],
+            default=0.5
+        )
+        boosts = np.fromiter(
+            (2.0 if _HIGH_VOLUME_RE.search(k) else 1.0 for k in keywords),
+            dtype=np.float64, count=count
+        )
+        return (1000 * multipliers * boosts).astype(np.int64).tolist()
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def calculate_keyword_difficulty(keyword: str) -> KeywordDifficulty:
         """Calculate keyword difficulty based on various factors"""
-        word_count = len(keyword.split())
+        word_count = keyword.count(' ') + 1
         
         # More specific keywords tend to be easier
         if word_count >= 4:
@@ -217,186 +408,291 @@ class KeywordResearcher:
         else:
             return KeywordDifficulty.VERY_HARD
     
-    def classify_search_intent(self, keyword: str) -> KeywordIntent:
-        """Classify search intent of keyword"""
-        keyword_lower = keyword.lower()
+    def calculate_keyword_difficulties(self, keywords: List[str]) -> List[KeywordDifficulty]:
+        """Calculate difficulty for a batch of keywords at once"""
+        if not NUMPY_AVAILABLE:
+            return [self.calculate_keyword_difficulty(keyword) for keyword in keywords]
         
+        word_counts = np.fromiter((k.count(' ') + 1 for k in keywords), dtype=np.int64, count=len(keywords))
+        levels = np.select(
+            [word_counts >= 4, word_counts == 3, word_counts == 2],
+            [KeywordDifficulty.EASY.value, KeywordDifficulty.MEDIUM.value, KeywordDifficulty.HARD.value],
+            default=KeywordDifficulty.VERY_HARD.value
+        )
+        return [_DIFF_BY_VALUE[level] for level in levels.tolist()]
+    
+    @staticmethod
+    def classify_search_intent(keyword: str) -> KeywordIntent:
+        """Classify search intent of keyword"""
+        return KeywordResearcher._classify_lowercase_intent(keyword.lower())
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _classify_lowercase_intent(keyword_lower: str) -> KeywordIntent:
+        """Classify search intent of an already lowercased keyword"""
         # Informational intent patterns
-        info_patterns = ["how to", "what is", "why", "guide", "tips", "help"]
-        if any(pattern in keyword_lower for pattern in info_patterns):
+        if _INFO_INTENT_RE.search(keyword_lower):
             return KeywordIntent.INFORMATIONAL
         
         # Transactional intent patterns
-        trans_patterns = ["buy", "purchase", "order", "hire", "book", "schedule"]
-        if any(pattern in keyword_lower for pattern in trans_patterns):
+        if _TRANS_INTENT_RE.search(keyword_lower):
             return KeywordIntent.TRANSACTIONAL
         
         # Commercial intent patterns
-        commercial_patterns = ["best", "top", "review", "compare", "vs", "cost", "price"]
-        if any(pattern in keyword_lower for pattern in commercial_patterns):
+        if _COMMERCIAL_INTENT_RE.search(keyword_lower):
             return KeywordIntent.COMMERCIAL
         
         # Default to informational for caregiving content
         return KeywordIntent.INFORMATIONAL
     
+    def classify_search_intents(self, keywords: List[str]) -> List[KeywordIntent]:
+        """Classify search intent for a batch of keywords"""
+        return [self._classify_lowercase_intent(keyword.lower()) for keyword in keywords]
+    
+    @staticmethod
+    def _related_rows(keywords: Iterable[Keyword]):
+        """Yield keyword_related insert rows for each keyword's term lists"""
+        for keyword in keywords:
+            for position, term in enumerate(keyword.related_terms):
+                yield (_RELATED_KIND, position, term, keyword.term)
+            for position, term in enumerate(keyword.questions):
+                yield (_QUESTION_KIND, position, term, keyword.term)
+    
     def add_keyword(self, keyword: Keyword):
         """Add keyword to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        self.add_keywords([keyword])
+    
+    def add_keywords(self, keywords: Iterable[Keyword]):
+        """Add many keywords to the database in a single transaction"""
+        keywords = list(keywords)
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO keywords 
-                (term, search_volume, difficulty, intent, category, subcategory, 
-                 cpc, competition, trending_score, related_terms, questions)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                keyword.term,
-                keyword.search_volume,
-                keyword.difficulty.value,
-                keyword.intent.value,
-                keyword.category,
-                keyword.subcategory,
-                keyword.cpc,
-                keyword.competition,
-                keyword.trending_score,
-                json.dumps(keyword.related_terms),
-                json.dumps(keyword.questions)
-            ))
-            conn.commit()
+            with self._conn:
+                # Term lists are rewritten, so drop any stored for these keywords first
+                self._conn.executemany(
+                    'DELETE FROM keyword_related WHERE keyword_id = (SELECT id FROM keywords WHERE term = ?)',
+                    ((keyword.term,) for keyword in keywords)
+                )
+                self._conn.executemany(self._insert_sql, map(_keyword_to_row, keywords))
+                
+                # A term repeated in the batch keeps only its last occurrence's lists
+                latest = {keyword.term: keyword for keyword in keywords}
+                self._conn.executemany(self._insert_related_sql, self._related_rows(latest.values()))
         except sqlite3.Error as e:
-            print(f"Error adding keyword {keyword.term}: {e}")
-        finally:
-            conn.close()
+            # The transaction rolled back, so none of the batch was stored
+            print(f"Error adding {len(keywords)} keywords (batch rolled back): {e}")
+    
+    def _iter_keyword_rows(self, where: str = "", params: Tuple = ()):
+        """Yield (columns, related_terms, questions) per keyword, by category and volume
+        
+        Term lists are joined in from keyword_related, so each keyword spans
+        several consecutive result rows that are grouped back together here.
+        """
+        columns = ", ".join(f"k.{column}" for column in KEYWORD_COLUMNS)
+        cursor = self._conn.execute(f'''
+            SELECT k.id, {columns}, r.kind, r.term
+            FROM keywords k LEFT JOIN keyword_related r ON r.keyword_id = k.id
+            {where}
+            ORDER BY k.category, k.search_volume DESC, k.id, r.kind, r.position
+        ''', params)
+        
+        for _, rows in groupby(cursor, key=itemgetter(0)):
+            rows = list(rows)
+            related_terms = [row[-1] for row in rows if row[-2] == _RELATED_KIND]
+            questions = [row[-1] for row in rows if row[-2] == _QUESTION_KIND]
+            yield rows[0][1:-2], related_terms, questions
+    
+    @staticmethod
+    def _row_to_keyword(row: Tuple, related_terms: List[str], questions: List[str]) -> Keyword:
+        """Build a Keyword from KEYWORD_COLUMNS values and its term lists"""
+        return Keyword(
+            term=row[0],
+            search_volume=row[1],
+            difficulty=_DIFF_BY_VALUE[row[2]],
+            intent=_INTENT_BY_VALUE[row[3]],
+            category=row[4],
+            subcategory=row[5],
+            cpc=row[6],
+            competition=row[7],
+            trending_score=row[8],
+            related_terms=related_terms,
+            questions=questions
+        )
     
     def get_keywords_by_category(self, category: str) -> List[Keyword]:
         """Retrieve keywords by category"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return [
+            self._row_to_keyword(row, related_terms, questions)
+            for row, related_terms, questions
+            in self._iter_keyword_rows("WHERE k.category = ?", (category,))
+        ]
+    
+    def search_keywords(self, query: str, limit: int = 50, raw: bool = False) -> List[Keyword]:
+        """Search keyword terms and categories, best matches first
         
-        cursor.execute('''
-            SELECT * FROM keywords WHERE category = ? ORDER BY search_volume DESC
-        ''', (category,))
-        
-        keywords = []
-        for row in cursor.fetchall():
-            keyword = Keyword(
-                term=row[1],
-                search_volume=row[2],
-                difficulty=KeywordDifficulty(row[3]),
-                intent=KeywordIntent(row[4]),
-                category=row[5],
-                subcategory=row[6],
-                cpc=row[7],
-                competition=row[8],
-                trending_score=row[9],
-                related_terms=json.loads(row[10]) if row[10] else [],
-                questions=json.loads(row[11]) if row[11] else []
+        By default query is plain text: every whitespace-separated word must
+        appear, so "caregiver's", "how-to" and "self-care tips" are safe to pass.
+        With FTS5 each word is matched as a quoted phrase, ranked by relevance;
+        without it each word is a literal substring of the term, ordered by
+        search volume.
+        
+        raw=True passes query to FTS5 unchanged (e.g. "care*",
+        "dementia OR alzheimer"); invalid syntax then raises
+        sqlite3.OperationalError. Without FTS5 a raw query is still matched
+        as literal words.
+        """
+        words = query.split()
+        if not words:
+            return []
+        
+        if self.fts_available:
+            if not raw:
+                query = " ".join('"' + word.replace('"', '""') + '"' for word in words)
+            cursor = self._conn.execute('''
+                SELECT term FROM keywords_fts WHERE keywords_fts MATCH ? ORDER BY rank LIMIT ?
+            ''', (query, limit))
+        else:
+            # Escape LIKE wildcards so each word matches literally
+            patterns = tuple(
+                "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                for word in words
             )
-            keywords.append(keyword)
+            conditions = " AND ".join(["term LIKE ? ESCAPE '\\'"] * len(patterns))
+            cursor = self._conn.execute(f'''
+                SELECT term FROM keywords WHERE {conditions} ORDER BY search_volume DESC LIMIT ?
+            ''', patterns + (limit,))
+        terms = [row[0] for row in cursor]
+        if not terms:
+            return []
         
-        conn.close()
-        return keywords
+        # Load the matches with their term lists, then restore ranking order
+        placeholders = ", ".join("?" * len(terms))
+        found = {
+            row[0]: self._row_to_keyword(row, related_terms, questions)
+            for row, related_terms, questions
+            in self._iter_keyword_rows(f"WHERE k.term IN ({placeholders})", tuple(terms))
+        }
+        return [found[term] for term in terms]
     
     def research_keyword_set(self, seed_keywords: List[str], category: str):
         """Research a complete set of keywords for a category"""
+        # Write the whole category in one transaction
+        self.add_keywords(self.build_keyword_set(seed_keywords, category))
+    
+    def build_keyword_set(self, seed_keywords: List[str], category: str) -> List[Keyword]:
+        """Generate and score the keywords for a category without storing them"""
+        # Collect every term first: (term, subcategory, related_terms, questions)
+        entries = []
         for seed in seed_keywords:
-            # Main keyword
-            main_keyword = Keyword(
-                term=seed,
-                search_volume=self.estimate_search_volume(seed),
-                difficulty=self.calculate_keyword_difficulty(seed),
-                intent=self.classify_search_intent(seed),
-                category=category
-            )
-            
-            # Generate related terms and questions
-            main_keyword.related_terms = self.generate_longtail_keywords(seed, 5)
-            main_keyword.questions = self.generate_question_keywords(seed)
-            
-            self.add_keyword(main_keyword)
+            # Main keyword with generated related terms and questions
+            related_terms = self.generate_longtail_keywords(seed, 5)
+            questions = self.generate_question_keywords(seed)
+            entries.append((seed, None, related_terms, questions))
             
-            # Add long-tail variations
-            for longtail in main_keyword.related_terms:
-                longtail_keyword = Keyword(
-                    term=longtail,
-                    search_volume=self.estimate_search_volume(longtail),
-                    difficulty=self.calculate_keyword_difficulty(longtail),
-                    intent=self.classify_search_intent(longtail),
-                    category=category,
-                    subcategory="longtail"
-                )
-                self.add_keyword(longtail_keyword)
-            
-            # Add question variations
-            for question in main_keyword.questions[:3]:  # Limit to top 3
-                question_keyword = Keyword(
-                    term=question,
-                    search_volume=self.estimate_search_volume(question),
-                    difficulty=self.calculate_keyword_difficulty(question),
-                    intent=KeywordIntent.INFORMATIONAL,
-                    category=category,
-                    subcategory="questions"
-                )
-                self.add_keyword(question_keyword)
-    
-    def export_keywords_json(self, filename: str = "keyword_database.json"):
-        """Export all keywords to JSON file"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+            # Long-tail and question variations (limit questions to top 3)
+            entries.extend((longtail, "longtail", [], []) for longtail in related_terms)
+            entries.extend((question, "questions", [], []) for question in questions[:3])
         
-        cursor.execute('SELECT * FROM keywords ORDER BY category, search_volume DESC')
+        # Score all terms of the category in one batch
+        terms = [entry[0] for entry in entries]
+        volumes = self.estimate_search_volumes(terms)
+        difficulties = self.calculate_keyword_difficulties(terms)
         
-        keywords_data = {
-            "keywords": [],
-            "categories": {},
-            "stats": {}
-        }
+        # Each term is lowercased once; questions are always informational
+        # so they skip classification entirely
+        intents = [
+            KeywordIntent.INFORMATIONAL if subcategory == "questions"
+            else self._classify_lowercase_intent(term.lower())
+            for term, subcategory, _, _ in entries
+        ]
         
-        category_counts = {}
-        
-        for row in cursor.fetchall():
-            keyword_data = {
-                "term": row[1],
-                "search_volume": row[2],
-                "difficulty": row[3],
-                "intent": row[4],
-                "category": row[5],
-                "subcategory": row[6],
-                "cpc": row[7],
-                "competition": row[8],
-                "trending_score": row[9],
-                "related_terms": json.loads(row[10]) if row[10] else [],
-                "questions": json.loads(row[11]) if row[11] else []
-            }
-            keywords_data["keywords"].append(keyword_data)
-            
-            # Count by category
-            category = row[5]
-            category_counts[category] = category_counts.get(category, 0) + 1
+        return [
+            Keyword(
+                term=term,
+                search_volume=volume,
+                difficulty=difficulty,
+                intent=intent,
+                category=category,
+                subcategory=subcategory,
+                related_terms=related_terms,
+                questions=questions
+            )
+            for (term, subcategory, related_terms, questions), volume, difficulty, intent
+            in zip(entries, volumes, difficulties, intents)
+        ]
+    
+    def export_keywords_json(self, filename: str = "keyword_database.json",
+                             indent: Optional[int] = 2):
+        """Export all keywords to JSON file, streaming rows from the database
+        
+        Pass indent=None for compact output.
+        """
+        cursor = self._conn.cursor()
         
-        keywords_data["categories"] = category_counts
-        keywords_data["stats"] = {
-            "total_keywords": len(keywords_data["keywords"]),
+        # Count by category in SQL so rows never need to be held in memory
+        category_counts = dict(cursor.execute(
+            'SELECT category, COUNT(*) FROM keywords GROUP BY category ORDER BY category'
+        ))
+        stats = {
+            "total_keywords": sum(category_counts.values()),
             "categories": len(category_counts)
         }
         
+        # Layout matching json.dump for the same indent
+        if indent is None:
+            separators = (",", ":")
+            newline, pad = "", ""
+        else:
+            separators = (",", ": ")
+            newline, pad = "\n", " " * indent
+        
+        def dumps(value, depth: int) -> str:
+            text = json.dumps(value, indent=indent, separators=separators)
+            return text.replace("\n", "\n" + pad * depth) if newline else text
+        
         output_path = self.data_dir / filename
         with open(output_path, 'w') as f:
-            json.dump(keywords_data, f, indent=2)
+            f.write("{" + newline + pad + '"keywords"' + separators[1] + "[")
+            
+            item_prefix = newline + pad * 2
+            for row, related_terms, questions in self._iter_keyword_rows():
+                keyword_data = {
+                    "term": row[0],
+                    "search_volume": row[1],
+                    "difficulty": row[2],
+                    "intent": row[3],
+                    "category": row[4],
+                    "subcategory": row[5],
+                    "cpc": row[6],
+                    "competition": row[7],
+                    "trending_score": row[8],
+                    "related_terms": related_terms,
+                    "questions": questions
+                }
+                f.write(item_prefix + dumps(keyword_data, 2))
+                item_prefix = "," + newline + pad * 2
+            
+            # Close the list on its own line only when it has items
+            if category_counts:
+                f.write(newline + pad)
+            f.write("]")
+            
+            f.write("," + newline + pad + '"categories"' + separators[1] + dumps(category_counts, 1))
+            f.write("," + newline + pad + '"stats"' + separators[1] + dumps(stats, 1))
+            f.write(newline + "}")
         
-        conn.close()
         return output_path
 
     def build_complete_database(self):
         """Build the complete keyword database"""
         print("Building comprehensive keyword database...")
         
-        # Research all keyword categories
+        # Research all keyword categories, then store them in one transaction
+        researched = []
         for category, keywords in self.config.items():
             if isinstance(keywords, list):
                 print(f"Researching {category}...")
-                self.research_keyword_set(keywords, category)
+                researched.extend(self.build_keyword_set(keywords, category))
+        self.add_keywords(researched)
         
         print("Keyword database build complete!")
         return self.export_keywords_json()
@@ -404,4 +700,5 @@ class KeywordResearcher:
 if __name__ == "__main__":
     researcher = KeywordResearcher()
     db_path = researcher.build_complete_database()
+    researcher.close()
     print(f"Keyword database exported to: {db_path}")
\ No newline at end of file
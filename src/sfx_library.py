@@ -8,8 +8,11 @@ import json
 import os
 import random
 import tempfile
+import wave
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Try to import audio generation libraries
@@ -24,12 +27,207 @@ except ImportError:
 
 try:
     from pydub import AudioSegment
-    from pydub.generators import Sine, Square, Sawtooth, Triangle
     PYDUB_AVAILABLE = True
 except ImportError:
     PYDUB_AVAILABLE = False
     print("pydub not available - sound synthesis disabled")
 
+try:
+    import soundfile
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
+try:
+    import mutagen
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = SCIPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Emotional tones each SFX category suits, in addition to the effect's own
+_CATEGORY_EMOTIONS = {
+    'notification': frozenset({'neutral', 'informative', 'attention'}),
+    'transition': frozenset({'smooth', 'neutral', 'flowing'}),
+    'emotional_accent': frozenset({'emotional', 'dramatic', 'touching'}),
+    'text_reveal': frozenset({'informative', 'neutral', 'engaging'}),
+    'ambient': frozenset({'calm', 'peaceful', 'background'})
+}
+_DEFAULT_EMOTIONS = frozenset({'neutral'})
+
+# Audio formats validate_sfx_file accepts, and how its error message lists them
+_VALID_SFX_FORMATS = frozenset({'.wav', '.mp3', '.aac', '.m4a', '.ogg'})
+_VALID_SFX_FORMATS_STR = '.wav, .mp3, .aac, .m4a, .ogg'
+
+# Range defaults for categories whose config omits them; shown as lists like
+# the JSON values, and the README keeps its narrower duration hint
+_DEFAULT_VOLUME_RANGE = (0.3, 0.7)
+_DEFAULT_DURATION_RANGE = (0.1, 10.0)
+_README_DURATION_RANGE = (0.5, 2.0)
+
+# Per-category README written by SFXLibrary.create_library_structure
+_README_TEMPLATE = """# {title} Sound Effects
+
+{description}
+
+## Characteristics
+{characteristics}
+
+## Usage Contexts
+{usage_contexts}
+
+## Examples
+{examples}
+
+## Technical Requirements
+- Volume Range: {volume_range}
+- Duration Range: {duration_range} seconds
+- Format: WAV preferred, 44.1kHz, 16-bit, mono
+- Normalization: Yes, but preserve dynamics
+
+## Usage Guidelines
+{frequency}
+
+Volume: {volume_mixing}
+
+Timing: {timing}
+"""
+
+
+@lru_cache(maxsize=64)
+def _hann_window(length: int):
+    """Shared read-only float32 Hann window of the given length"""
+    window = signal.windows.hann(length).astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
+def _sine_wave(freq: float, duration_ms: int, sample_rate: int):
+    """Sine wave in [-1, 1], sample for sample what pydub's Sine generator yields"""
+    sample_n = np.arange(int(sample_rate * (duration_ms / 1000.0)))
+    return np.sin(((freq * 2 * np.pi) / sample_rate) * sample_n)
+
+
+def _square_wave(freq: float, duration_ms: int, sample_rate: int):
+    """Square wave in [-1, 1], sample for sample what pydub's Square generator yields"""
+    sample_n = np.arange(int(sample_rate * (duration_ms / 1000.0)))
+    cycle_length = sample_rate / float(freq)
+    return np.where(sample_n % cycle_length < cycle_length * 0.5, 1.0, -1.0)
+
+
+def _apply_fades(samples, fade_in_ms: int, fade_out_ms: int, sample_rate: int):
+    """Linear fade in and fade out applied in place, like pydub's per-sample fades"""
+    fade_in = fade_in_ms * sample_rate / 1000.0
+    fade_in_samples = min(int(fade_in), len(samples))
+    samples[:fade_in_samples] *= np.arange(fade_in_samples) / fade_in
+    
+    fade_out = fade_out_ms * sample_rate / 1000.0
+    fade_out_samples = min(int(fade_out), len(samples))
+    samples[len(samples) - fade_out_samples:] *= 1.0 - np.arange(fade_out_samples) / fade_out
+    return samples
+
+
+def _to_int16(samples):
+    """Round float samples in [-1, 1] to saturated 16-bit PCM"""
+    scaled = samples * 32767.0
+    np.clip(scaled, -32768, 32767, out=scaled)
+    np.rint(scaled, out=scaled)
+    return scaled.astype(np.int16)
+
+
+@lru_cache(maxsize=128)
+def _render_tone(kind: str, freq: float, duration_ms: int, sample_rate: int) -> bytes:
+    """Raw 16-bit mono samples of a 'sine' or 'square' tone, synthesized once per shape"""
+    wave = _sine_wave if kind == 'sine' else _square_wave
+    return _to_int16(wave(freq, duration_ms, sample_rate)).tobytes()
+
+
+def _samples_to_segment(samples, sample_rate: int):
+    """Wrap float samples in [-1, 1] as a 16-bit mono AudioSegment"""
+    audio_data = _to_int16(samples)
+    return AudioSegment(
+        audio_data.tobytes(),
+        frame_rate=sample_rate,
+        sample_width=2,
+        channels=1
+    )
+
+
+def _probe_duration(path: str, suffix: str) -> Optional[float]:
+    """Duration in seconds read from the file's headers, or None if no header reader handles it"""
+    if SOUNDFILE_AVAILABLE:
+        try:
+            return soundfile.info(path).duration
+        except RuntimeError:
+            pass
+    
+    if suffix == '.wav':
+        try:
+            with wave.open(path, 'rb') as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError):
+            pass
+    
+    if MUTAGEN_AVAILABLE:
+        info = getattr(mutagen.File(path), 'info', None)
+        if info is not None:
+            return info.length
+    
+    return None
+
+
+@lru_cache(maxsize=4)
+def _load_catalog(path_str: str, mtime: float) -> dict:
+    """Parsed SFX catalog, re-read only when the file's mtime changes"""
+    with open(path_str) as f:
+        return json.load(f)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _whoosh_kernel(noise, phase, envelope):
+        """noise * sin(phase) * envelope in one fused parallel pass"""
+        out = np.empty_like(noise)
+        for i in prange(noise.shape[0]):
+            out[i] = noise[i] * np.sin(phase[i]) * envelope[i]
+        return out
+    
+    @njit(cache=True)
+    def _peak_kernel(samples):
+        """Largest absolute sample, folding abs and max into one pass"""
+        peak = 0.0
+        for value in samples:
+            magnitude = abs(value)
+            if magnitude > peak:
+                peak = magnitude
+        return peak
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _bird_tones_kernel(buffer, starts, freqs, lengths, sample_rate, amplitude):
+        """Add Hann-windowed sine tones into buffer in place"""
+        for k in range(starts.shape[0]):
+            start = starts[k]
+            length = lengths[k]
+            step = 2.0 * np.pi * freqs[k] / sample_rate
+            window_step = 2.0 * np.pi / (length - 1) if length > 1 else 0.0
+            # Tones may overlap, so only the samples within one tone run in parallel
+            for i in prange(length):
+                window = 0.5 - 0.5 * np.cos(window_step * i) if length > 1 else 1.0
+                buffer[start + i] += amplitude * np.sin(step * i) * window
+
+
+def _peak(samples):
+    """Largest absolute sample, without materializing np.abs(samples)"""
+    if NUMBA_AVAILABLE:
+        return _peak_kernel(samples)
+    return max(samples.max(), -samples.min())
+
 
 class SoundEffect:
     """Represents a sound effect with metadata and usage context"""
@@ -50,28 +248,32 @@ class SoundEffect:
         self.sample_rate = self.metadata.get('sample_rate', 44100)
         self.format = self.metadata.get('format', 'wav')
         self.channels = self.metadata.get('channels', 1)  # Mono by default for SFX
+        
+        # Precomputed suitability sets so context checks are hash lookups
+        self._contexts = frozenset(self.usage_context)
+        self._any_context = 'general' in self._contexts
+        self._emotions = _CATEGORY_EMOTIONS.get(self.category, _DEFAULT_EMOTIONS) | {self.emotional_impact}
+    
+    def to_audio_segment(self) -> 'AudioSegment':
+        """Audio as a pydub segment, from in-memory PCM when the effect was generated without a file"""
+        pcm = self.metadata.get('pcm')
+        if pcm is not None:
+            return AudioSegment(
+                pcm.tobytes(),
+                frame_rate=self.sample_rate,
+                sample_width=2,
+                channels=1
+            )
+        return AudioSegment.from_file(str(self.file_path))
     
     def is_suitable_for_context(self, context: str, emotional_tone: str = None) -> bool:
         """Check if this SFX is suitable for a given context and emotional tone"""
         # Check usage context
-        if context not in self.usage_context and 'general' not in self.usage_context:
+        if not self._any_context and context not in self._contexts:
             return False
         
         # Check emotional compatibility if specified
-        if emotional_tone:
-            compatible_emotions = {
-                'notification': ['neutral', 'informative', 'attention'],
-                'transition': ['smooth', 'neutral', 'flowing'],
-                'emotional_accent': ['emotional', 'dramatic', 'touching'],
-                'text_reveal': ['informative', 'neutral', 'engaging'],
-                'ambient': ['calm', 'peaceful', 'background']
-            }
-            
-            category_emotions = compatible_emotions.get(self.category, ['neutral'])
-            if emotional_tone not in category_emotions and self.emotional_impact != emotional_tone:
-                return False
-        
-        return True
+        return not emotional_tone or emotional_tone in self._emotions
 
 
 class SFXGenerator:
@@ -79,17 +281,54 @@ class SFXGenerator:
     
     def __init__(self, sample_rate: int = 44100):
         self.sample_rate = sample_rate
+        
+        # PCG64 generator for noise; much faster than the legacy global RandomState
+        self._rng = np.random.default_rng() if SCIPY_AVAILABLE else None
+        
+        # Room tone low-pass, designed once as second-order sections
+        self._room_sos = (
+            signal.butter(4, 2000 / (self.sample_rate / 2), 'low', output='sos')
+            if SCIPY_AVAILABLE else None
+        )
+    
+    def _tone(self, kind: str, freq: float, duration_ms: int) -> 'AudioSegment':
+        """Tone segment built from the shared tone cache"""
+        return AudioSegment(
+            _render_tone(kind, freq, duration_ms, self.sample_rate),
+            frame_rate=self.sample_rate,
+            sample_width=2,
+            channels=1
+        )
+    
+    def _export_pcm(self, audio_data, return_array: bool):
+        """(samples, sample_rate) for in-memory use, else the path of a temp WAV holding them"""
+        if return_array:
+            return audio_data, self.sample_rate
+        
+        temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+        wavfile.write(temp_file.name, self.sample_rate, audio_data)
+        return temp_file.name
     
-    def generate_notification_sound(self, style: str = 'gentle', duration: float = 0.5) -> Optional[str]:
+    def _export_segment(self, segment: 'AudioSegment', return_array: bool):
+        """Like _export_pcm, for a 16-bit mono segment, skipping pydub's WAV encoder when in memory"""
+        if return_array:
+            return np.frombuffer(segment.raw_data, dtype=np.int16), segment.frame_rate
+        
+        temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+        segment.export(temp_file.name, format='wav')
+        return temp_file.name
+    
+    def generate_notification_sound(self, style: str = 'gentle', duration: float = 0.5,
+                                    return_array: bool = False) -> Optional[Union[str, Tuple]]:
         """Generate a notification sound"""
-        if not PYDUB_AVAILABLE:
+        if not (SCIPY_AVAILABLE and PYDUB_AVAILABLE):
             return None
         
         try:
             if style == 'gentle':
                 # Soft bell-like notification
-                tone1 = Sine(800).to_audio_segment(duration=int(duration * 500))
-                tone2 = Sine(1200).to_audio_segment(duration=int(duration * 300))
+                tone1 = self._tone('sine', 800, int(duration * 500))
+                tone2 = self._tone('sine', 1200, int(duration * 300))
                 
                 # Apply envelope
                 tone1 = tone1.fade_in(50).fade_out(200)
@@ -100,16 +339,16 @@ class SFXGenerator:
                 
             elif style == 'urgent':
                 # More attention-getting notification
-                tone1 = Square(600).to_audio_segment(duration=int(duration * 200))
-                tone2 = Square(900).to_audio_segment(duration=int(duration * 200))
-                tone3 = Square(600).to_audio_segment(duration=int(duration * 200))
+                tone1 = self._tone('square', 600, int(duration * 200))
+                tone2 = self._tone('square', 900, int(duration * 200))
+                tone3 = self._tone('square', 600, int(duration * 200))
                 
                 notification = tone1 + tone2 + tone3
                 notification = notification.fade_in(20).fade_out(50)
                 
             elif style == 'subtle':
                 # Very subtle notification
-                tone = Sine(1000).to_audio_segment(duration=int(duration * 1000))
+                tone = self._tone('sine', 1000, int(duration * 1000))
                 notification = tone.fade_in(100).fade_out(300)
                 notification = notification - 20  # Reduce volume
                 
@@ -118,90 +357,87 @@ class SFXGenerator:
             
             # Normalize and export
             notification = notification.normalize()
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            notification.export(temp_file.name, format='wav')
-            
-            return temp_file.name
+            return self._export_segment(notification, return_array)
             
         except Exception as e:
             print(f"Error generating notification sound: {e}")
             return None
     
-    def generate_transition_whoosh(self, direction: str = 'forward', intensity: float = 0.5) -> Optional[str]:
+    def generate_transition_whoosh(self, direction: str = 'forward', intensity: float = 0.5,
+                                   return_array: bool = False) -> Optional[Union[str, Tuple]]:
         """Generate a transition whoosh sound"""
-        if not (SCIPY_AVAILABLE and PYDUB_AVAILABLE):
+        if not SCIPY_AVAILABLE:
             return None
         
         try:
             duration = 1.0  # 1 second whoosh
-            t = np.linspace(0, duration, int(self.sample_rate * duration))
+            # Synthesis runs in float32; 16-bit output cannot resolve more.
+            # Only the sample count is needed, so no time axis is built.
+            n_samples = int(self.sample_rate * duration)
             
             # Create noise base
-            noise = np.random.normal(0, 0.1, len(t))
+            noise = self._rng.standard_normal(n_samples, dtype=np.float32)
+            noise *= 0.1
             
             # Apply frequency sweep (whoosh effect)
             if direction == 'forward':
-                freq_sweep = np.linspace(2000, 200, len(t)) * intensity
+                freq_sweep = np.linspace(2000, 200, n_samples, dtype=np.float32)
+                freq_sweep *= intensity
             elif direction == 'reverse':
-                freq_sweep = np.linspace(200, 2000, len(t)) * intensity
+                freq_sweep = np.linspace(200, 2000, n_samples, dtype=np.float32)
+                freq_sweep *= intensity
             else:  # 'neutral'
-                freq_sweep = np.ones(len(t)) * 800 * intensity
+                freq_sweep = np.full(n_samples, 800 * intensity, dtype=np.float32)
             
-            # Apply sweep to noise
-            whoosh = np.zeros_like(t)
-            for i in range(len(t)):
-                whoosh[i] = noise[i] * np.sin(2 * np.pi * freq_sweep[i] * t[i])
+            # Apply sweep to noise; the phase is the running integral of the
+            # instantaneous frequency so the sweep is a true chirp. The running
+            # sum is kept in float64 so the phase does not drift.
+            phase = np.cumsum(freq_sweep, dtype=np.float64)
+            phase *= 2 * np.pi / self.sample_rate
+            phase = phase.astype(np.float32)
             
-            # Apply envelope
-            envelope = signal.windows.hann(len(t))
-            whoosh *= envelope
+            # Modulate and apply envelope, reusing the phase buffer as output
+            if NUMBA_AVAILABLE:
+                whoosh = _whoosh_kernel(noise, phase, _hann_window(n_samples))
+            else:
+                whoosh = np.sin(phase, out=phase)
+                whoosh *= noise
+                whoosh *= _hann_window(n_samples)
             
             # Normalize
-            whoosh = whoosh / np.max(np.abs(whoosh))
-            
-            # Convert to audio segment
-            audio_data = (whoosh * 32767).astype(np.int16)
-            audio_segment = AudioSegment(
-                audio_data.tobytes(),
-                frame_rate=self.sample_rate,
-                sample_width=2,
-                channels=1
-            )
-            
-            # Export
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            audio_segment.export(temp_file.name, format='wav')
+            whoosh /= _peak(whoosh)
             
-            return temp_file.name
+            # Hand back 16-bit PCM, or write it straight to WAV
+            return self._export_pcm(_to_int16(whoosh), return_array)
             
         except Exception as e:
             print(f"Error generating whoosh: {e}")
             return None
     
-    def generate_text_reveal_sound(self, style: str = 'typewriter') -> Optional[str]:
+    def generate_text_reveal_sound(self, style: str = 'typewriter',
+                                   return_array: bool = False) -> Optional[Union[str, Tuple]]:
         """Generate text reveal sound effects"""
-        if not PYDUB_AVAILABLE:
+        if not (SCIPY_AVAILABLE and PYDUB_AVAILABLE):
             return None
         
         try:
             if style == 'typewriter':
-                # Short click sounds
+                # Short click sounds, rendered into one sample buffer
                 base_freq = 800
                 duration_ms = 30
+                gap = np.zeros(int(self.sample_rate * 0.01))  # 10ms between clicks
                 
-                clicks = []
+                parts = []
                 for i in range(5):  # 5 quick clicks
                     freq = base_freq + random.randint(-100, 100)
-                    click = Square(freq).to_audio_segment(duration=duration_ms)
-                    click = click.fade_in(5).fade_out(10)
-                    clicks.append(click)
-                
-                # Combine with small gaps
-                result = AudioSegment.empty()
-                for i, click in enumerate(clicks):
+                    click = _square_wave(freq, duration_ms, self.sample_rate)
+                    _apply_fades(click, 5, 10, self.sample_rate)
+                    
                     if i > 0:
-                        result += AudioSegment.silent(duration=10)
-                    result += click
+                        parts.append(gap)
+                    parts.append(click)
+                
+                result = _samples_to_segment(np.concatenate(parts), self.sample_rate)
                 
             elif style == 'digital':
                 # Digital beep sequence
@@ -209,14 +445,14 @@ class SFXGenerator:
                 result = AudioSegment.empty()
                 
                 for freq in freqs:
-                    beep = Sine(freq).to_audio_segment(duration=50)
+                    beep = self._tone('sine', freq, 50)
                     beep = beep.fade_in(10).fade_out(10)
                     result += beep + AudioSegment.silent(duration=20)
                 
             elif style == 'gentle_chime':
                 # Soft chime
-                tone1 = Sine(880).to_audio_segment(duration=200)
-                tone2 = Sine(1320).to_audio_segment(duration=150)
+                tone1 = self._tone('sine', 880, 200)
+                tone2 = self._tone('sine', 1320, 150)
                 
                 result = tone1.overlay(tone2, position=50)
                 result = result.fade_in(30).fade_out(80)
@@ -226,38 +462,34 @@ class SFXGenerator:
             
             # Normalize and export
             result = result.normalize()
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            result.export(temp_file.name, format='wav')
-            
-            return temp_file.name
+            return self._export_segment(result, return_array)
             
         except Exception as e:
             print(f"Error generating text reveal sound: {e}")
             return None
     
-    def generate_emotional_accent(self, emotion: str = 'touching') -> Optional[str]:
+    def generate_emotional_accent(self, emotion: str = 'touching',
+                                  return_array: bool = False) -> Optional[Union[str, Tuple]]:
         """Generate emotional accent sounds"""
-        if not PYDUB_AVAILABLE:
+        if not (SCIPY_AVAILABLE and PYDUB_AVAILABLE):
             return None
         
         try:
             if emotion == 'touching':
-                # Soft, warm tone
+                # Soft, warm tone, summed directly in one float buffer
                 fundamental = 220  # A3
                 harmonics = [1, 0.5, 0.3, 0.2]  # Harmonic series weights
                 
-                result = AudioSegment.empty()
+                buffer = np.zeros(int(self.sample_rate * 0.8))  # 800ms
                 for i, weight in enumerate(harmonics):
                     freq = fundamental * (i + 1)
-                    tone = Sine(freq).to_audio_segment(duration=800)
-                    tone = tone - (20 - int(weight * 20))  # Adjust volume by harmonic weight
-                    
-                    if i == 0:
-                        result = tone
-                    else:
-                        result = result.overlay(tone)
+                    # Adjust volume by harmonic weight (in dB, as before)
+                    gain = 10 ** (-(20 - int(weight * 20)) / 20)
+                    buffer += gain * _sine_wave(freq, 800, self.sample_rate)
                 
-                result = result.fade_in(200).fade_out(300)
+                _apply_fades(buffer, 200, 300, self.sample_rate)
+                buffer /= _peak(buffer)
+                result = _samples_to_segment(buffer, self.sample_rate)
                 
             elif emotion == 'hopeful':
                 # Rising tones
@@ -265,7 +497,7 @@ class SFXGenerator:
                 result = AudioSegment.empty()
                 
                 for i, freq in enumerate(freqs):
-                    tone = Sine(freq).to_audio_segment(duration=150)
+                    tone = self._tone('sine', freq, 150)
                     tone = tone.fade_in(20).fade_out(50)
                     
                     if i == 0:
@@ -275,8 +507,8 @@ class SFXGenerator:
                 
             elif emotion == 'calming':
                 # Low, warm drone
-                base = Sine(110).to_audio_segment(duration=1000)  # Low A
-                fifth = Sine(165).to_audio_segment(duration=1000)  # Perfect fifth
+                base = self._tone('sine', 110, 1000)  # Low A
+                fifth = self._tone('sine', 165, 1000)  # Perfect fifth
                 
                 result = base.overlay(fifth - 6)  # Fifth slightly quieter
                 result = result.fade_in(300).fade_out(400)
@@ -286,53 +518,59 @@ class SFXGenerator:
             
             # Normalize and export
             result = result.normalize() - 10  # Keep emotional accents subtle
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            result.export(temp_file.name, format='wav')
-            
-            return temp_file.name
+            return self._export_segment(result, return_array)
             
         except Exception as e:
             print(f"Error generating emotional accent: {e}")
             return None
     
-    def generate_ambient_background(self, ambience: str = 'room_tone', duration: float = 10.0) -> Optional[str]:
+    def _add_bird_tones(self, buffer, starts, freqs, lengths, amplitude: float = 0.005):
+        """Mix Hann-windowed sine tones, given as parallel start/freq/length arrays, into buffer in place"""
+        if not len(starts):
+            return
+        
+        if NUMBA_AVAILABLE:
+            _bird_tones_kernel(buffer, starts, freqs, lengths, float(self.sample_rate), amplitude)
+            return
+        
+        for start_idx, freq, tone_samples in zip(starts, freqs, lengths):
+            phase = (2 * np.pi * freq / self.sample_rate) * np.arange(tone_samples)
+            tone = np.sin(phase)
+            tone *= _hann_window(tone_samples)
+            tone *= amplitude
+            buffer[start_idx:start_idx + tone_samples] += tone
+    
+    def generate_ambient_background(self, ambience: str = 'room_tone', duration: float = 10.0,
+                                    return_array: bool = False) -> Optional[Union[str, Tuple]]:
         """Generate ambient background sounds"""
-        if not (SCIPY_AVAILABLE and PYDUB_AVAILABLE):
+        if not SCIPY_AVAILABLE:
             return None
         
         try:
-            t = np.linspace(0, duration, int(self.sample_rate * duration))
+            n_samples = int(self.sample_rate * duration)
             
             if ambience == 'room_tone':
                 # Very subtle room tone
-                noise = np.random.normal(0, 0.01, len(t))
+                noise = self._rng.standard_normal(n_samples, dtype=np.float32)
+                noise *= 0.01
                 
                 # Filter to remove harsh frequencies
-                from scipy.signal import butter, filtfilt
-                b, a = butter(4, 2000 / (self.sample_rate / 2), 'low')
-                filtered_noise = filtfilt(b, a, noise)
-                
-                audio = filtered_noise
+                audio = signal.sosfiltfilt(self._room_sos, noise)
                 
             elif ambience == 'nature_soft':
                 # Soft nature ambience
-                base_noise = np.random.normal(0, 0.02, len(t))
-                
-                # Add occasional soft bird-like tones
-                for _ in range(int(duration / 3)):  # Every 3 seconds on average
-                    start_idx = random.randint(0, len(t) - self.sample_rate)
-                    freq = random.randint(800, 2000)
-                    tone_duration = random.uniform(0.1, 0.5)
-                    tone_samples = int(tone_duration * self.sample_rate)
+                base_noise = self._rng.standard_normal(n_samples, dtype=np.float32)
+                base_noise *= 0.02
+                
+                # Add occasional soft bird-like tones, sampled all at once
+                n_tones = int(duration / 3)  # Every 3 seconds on average
+                if n_tones:
+                    starts = self._rng.integers(0, n_samples - self.sample_rate, n_tones, endpoint=True)
+                    freqs = self._rng.integers(800, 2000, n_tones, endpoint=True)
+                    lengths = (self._rng.uniform(0.1, 0.5, n_tones) * self.sample_rate).astype(np.int64)
                     
-                    if start_idx + tone_samples < len(t):
-                        tone = 0.005 * np.sin(2 * np.pi * freq * 
-                                            np.linspace(0, tone_duration, tone_samples))
-                        envelope = signal.windows.hann(len(tone))
-                        tone *= envelope
-                        
-                        end_idx = start_idx + len(tone)
-                        base_noise[start_idx:end_idx] += tone
+                    fits = starts + lengths < n_samples
+                    self._add_bird_tones(base_noise, starts[fits], freqs[fits], lengths[fits])
                 
                 audio = base_noise
                 
@@ -340,22 +578,10 @@ class SFXGenerator:
                 return None
             
             # Normalize
-            audio = audio / np.max(np.abs(audio)) * 0.3  # Keep ambient very quiet
-            
-            # Convert to audio segment
-            audio_data = (audio * 32767).astype(np.int16)
-            audio_segment = AudioSegment(
-                audio_data.tobytes(),
-                frame_rate=self.sample_rate,
-                sample_width=2,
-                channels=1
-            )
+            audio = audio / _peak(audio) * 0.3  # Keep ambient very quiet
             
-            # Export
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            audio_segment.export(temp_file.name, format='wav')
-            
-            return temp_file.name
+            # Hand back 16-bit PCM, or write it straight to WAV
+            return self._export_pcm(_to_int16(audio), return_array)
             
         except Exception as e:
             print(f"Error generating ambient background: {e}")
@@ -379,13 +605,17 @@ class SFXLibrary:
         
         # Initialize library
         self._load_config()
+        
+        # Category table and its names for error messages, looked up once
+        self._categories = self.config.get('categories', {})
+        self._category_names_str = ', '.join(self._categories)
+        
         self._scan_library()
     
     def _load_config(self):
         """Load SFX catalog configuration"""
         if self.config_path.exists():
-            with open(self.config_path) as f:
-                self.config = json.load(f)
+            self.config = _load_catalog(str(self.config_path), os.path.getmtime(self.config_path))
         else:
             self._create_default_config()
     
@@ -558,9 +788,14 @@ class SFXLibrary:
         for category in categories:
             category_path = self.library_path / category
             if category_path.exists():
-                sfx_files = []
-                for ext in audio_extensions:
-                    sfx_files.extend(category_path.glob(f'*{ext}'))
+                # One directory pass; grouped by extension as the old per-extension globs were
+                with os.scandir(category_path) as entries:
+                    sfx_files = [
+                        Path(entry.path) for entry in entries
+                        if entry.is_file(follow_symlinks=False)
+                        and os.path.splitext(entry.name)[1].lower() in audio_extensions
+                    ]
+                sfx_files.sort(key=lambda sfx_file: audio_extensions.index(sfx_file.suffix.lower()))
                 
                 category_sfx = []
                 for sfx_file in sfx_files:
@@ -579,31 +814,39 @@ class SFXLibrary:
         
         print(f"Scanned SFX library: {len(self.all_sfx)} effects across {len(self.sfx_by_category)} categories")
     
-    def get_sfx(self, category: str, context: str = None, emotional_tone: str = None) -> Optional[SoundEffect]:
-        """Get a sound effect for specific category and context"""
-        
-        # Check if we have files for this category
-        if category in self.sfx_by_category and self.sfx_by_category[category]:
-            suitable_sfx = []
-            for sfx in self.sfx_by_category[category]:
-                if sfx.is_suitable_for_context(context or 'general', emotional_tone):
-                    suitable_sfx.append(sfx)
-            
-            if suitable_sfx:
-                return random.choice(suitable_sfx)
+    def _suitable_sfx(self, category: str, context: str = None, emotional_tone: str = None) -> List[SoundEffect]:
+        """Library sound effects of a category that suit the context and tone"""
+        return [
+            sfx for sfx in self.sfx_by_category.get(category, [])
+            if sfx.is_suitable_for_context(context or 'general', emotional_tone)
+        ]
+    
+    def _pick_sfx(self, suitable_sfx: List[SoundEffect], category: str, context: str = None,
+                  emotional_tone: str = None) -> Optional[SoundEffect]:
+        """Choose from prefiltered candidates, generating one procedurally if there are none"""
+        if suitable_sfx:
+            return random.choice(suitable_sfx)
         
         # If no suitable file found, try to generate one procedurally
         return self._generate_fallback_sfx(category, context, emotional_tone)
     
+    def get_sfx(self, category: str, context: str = None, emotional_tone: str = None) -> Optional[SoundEffect]:
+        """Get a sound effect for specific category and context"""
+        suitable_sfx = self._suitable_sfx(category, context, emotional_tone)
+        return self._pick_sfx(suitable_sfx, category, context, emotional_tone)
+    
     def _generate_fallback_sfx(self, category: str, context: str = None, 
-                              emotional_tone: str = None) -> Optional[SoundEffect]:
-        """Generate a fallback sound effect when no file is available"""
+                              emotional_tone: str = None, in_memory: bool = False) -> Optional[SoundEffect]:
+        """Generate a fallback sound effect when no file is available
+        
+        With in_memory the samples are kept in metadata['pcm'] instead of a temp WAV.
+        """
         
         generated_file = None
         
         if category == 'notification':
             style = 'gentle' if emotional_tone in ['touching', 'calm'] else 'subtle'
-            generated_file = self.generator.generate_notification_sound(style)
+            generated_file = self.generator.generate_notification_sound(style, return_array=in_memory)
             
         elif category == 'transition':
             direction = 'neutral'
@@ -611,19 +854,19 @@ class SFXLibrary:
                 direction = 'forward'
             elif context and 'back' in context:
                 direction = 'reverse'
-            generated_file = self.generator.generate_transition_whoosh(direction)
+            generated_file = self.generator.generate_transition_whoosh(direction, return_array=in_memory)
             
         elif category == 'text_reveal':
             style = 'gentle_chime' if emotional_tone == 'touching' else 'digital'
-            generated_file = self.generator.generate_text_reveal_sound(style)
+            generated_file = self.generator.generate_text_reveal_sound(style, return_array=in_memory)
             
         elif category == 'emotional_accent':
             emotion = emotional_tone or 'touching'
-            generated_file = self.generator.generate_emotional_accent(emotion)
+            generated_file = self.generator.generate_emotional_accent(emotion, return_array=in_memory)
             
         elif category == 'ambient':
             ambience = 'room_tone'
-            generated_file = self.generator.generate_ambient_background(ambience)
+            generated_file = self.generator.generate_ambient_background(ambience, return_array=in_memory)
         
         if generated_file:
             # Create SoundEffect object for generated file
@@ -635,6 +878,10 @@ class SFXLibrary:
                 'emotional_impact': emotional_tone or 'neutral'
             }
             
+            if in_memory:
+                metadata['pcm'], metadata['sample_rate'] = generated_file
+                return SoundEffect(f"generated_{category}", None, metadata)
+            
             return SoundEffect(f"generated_{category}", generated_file, metadata)
         
         return None
@@ -677,10 +924,12 @@ class SFXLibrary:
         
         # Add transition sounds at strategic points
         if 'transition' in preferred_categories and content_duration > 15:
-            # Add transitions at 25%, 50%, 75% marks for longer content
+            # Add transitions at 25%, 50%, 75% marks for longer content;
+            # the candidates are the same at every mark, so filter them once
+            transition_candidates = self._suitable_sfx('transition', 'section_change')
             for percent in [0.25, 0.5, 0.75]:
                 time_point = content_duration * percent
-                transition_sfx = self.get_sfx('transition', 'section_change')
+                transition_sfx = self._pick_sfx(transition_candidates, 'transition', 'section_change')
                 if transition_sfx:
                     timing_map.append({
                         'time': time_point,
@@ -708,101 +957,126 @@ class SFXLibrary:
     
     def create_library_structure(self):
         """Create the directory structure for the SFX library"""
-        categories = list(self.config.get('categories', {}).keys())
+        categories = self.config.get('categories', {})
         
-        for category in categories:
+        # Guideline tables are shared by every README, so look them up once
+        guidelines = self.config.get('usage_guidelines', {})
+        frequency = guidelines.get('frequency', {})
+        volume_mixing = guidelines.get('volume_mixing', {})
+        timing = guidelines.get('timing', {})
+        
+        readmes = []
+        for category, category_config in categories.items():
             category_dir = self.library_path / category
             category_dir.mkdir(parents=True, exist_ok=True)
             
             # Create README for each category
             readme_path = category_dir / "README.md"
-            category_config = self.config['categories'][category]
-            
-            readme_content = f"""# {category.replace('_', ' ').title()} Sound Effects
-
-{category_config.get('description', '')}
-
-## Characteristics
-{', '.join(category_config.get('characteristics', []))}
-
-## Usage Contexts
-{', '.join(category_config.get('usage_contexts', []))}
-
-## Examples
-{chr(10).join(f'- {example}' for example in category_config.get('examples', []))}
-
-## Technical Requirements
-- Volume Range: {category_config.get('volume_range', [0.3, 0.7])}
-- Duration Range: {category_config.get('duration_range', [0.5, 2.0])} seconds
-- Format: WAV preferred, 44.1kHz, 16-bit, mono
-- Normalization: Yes, but preserve dynamics
-
-## Usage Guidelines
-{self.config.get('usage_guidelines', {}).get('frequency', {}).get(category, '')}
-
-Volume: {self.config.get('usage_guidelines', {}).get('volume_mixing', {}).get(category, '')}
-
-Timing: {self.config.get('usage_guidelines', {}).get('timing', {}).get(category, '')}
-"""
             
-            readme_path.write_text(readme_content)
+            readmes.append((readme_path, _README_TEMPLATE.format_map({
+                'title': category.replace('_', ' ').title(),
+                'description': category_config.get('description', ''),
+                'characteristics': ', '.join(category_config.get('characteristics', [])),
+                'usage_contexts': ', '.join(category_config.get('usage_contexts', [])),
+                'examples': '\n'.join([f'- {example}' for example in category_config.get('examples', [])]),
+                'volume_range': list(category_config.get('volume_range', _DEFAULT_VOLUME_RANGE)),
+                'duration_range': list(category_config.get('duration_range', _README_DURATION_RANGE)),
+                'frequency': frequency.get(category, ''),
+                'volume_mixing': volume_mixing.get(category, ''),
+                'timing': timing.get(category, '')
+            })))
+        
+        # Write the READMEs concurrently so their open/write/close latencies overlap
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda readme: readme[0].write_text(readme[1]), readmes))
         
         print(f"✓ Created SFX library structure at {self.library_path}")
     
     def validate_sfx_file(self, file_path: str, category: str) -> Dict:
         """Validate an SFX file for library inclusion"""
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
+        # Plain string handling; one stat call stands in for Path.exists()
+        file_path = os.fspath(file_path)
+        try:
+            os.stat(file_path)
+        except OSError:
             return {"valid": False, "error": "File not found"}
         
         # Check file format
-        valid_formats = ['.wav', '.mp3', '.aac', '.m4a', '.ogg']
-        if file_path.suffix.lower() not in valid_formats:
-            return {"valid": False, "error": f"Invalid format. Use: {', '.join(valid_formats)}"}
+        extension = os.path.splitext(file_path)[1]
+        suffix = extension.lower()
+        if suffix not in _VALID_SFX_FORMATS:
+            return {"valid": False, "error": f"Invalid format. Use: {_VALID_SFX_FORMATS_STR}"}
         
         # Check category
-        if category not in self.config.get('categories', {}):
-            return {"valid": False, "error": f"Invalid category. Use: {', '.join(self.config.get('categories', {}).keys())}"}
+        if category not in self._categories:
+            return {"valid": False, "error": f"Invalid category. Use: {self._category_names_str}"}
         
-        category_config = self.config['categories'][category]
+        category_config = self._categories[category]
         
-        # Basic file validation
+        # Basic file validation; only the headers are read unless no header reader applies
         try:
-            if PYDUB_AVAILABLE:
-                audio = AudioSegment.from_file(str(file_path))
+            duration = _probe_duration(file_path, suffix)
+            if duration is None and PYDUB_AVAILABLE:
+                audio = AudioSegment.from_file(file_path)
                 duration = len(audio) / 1000.0
-                
+            
+            if duration is not None:
                 # Check duration range
-                duration_range = category_config.get('duration_range', [0.1, 10.0])
-                if not (duration_range[0] <= duration <= duration_range[1]):
+                min_duration, max_duration = category_config.get('duration_range', _DEFAULT_DURATION_RANGE)
+                if not min_duration <= duration <= max_duration:
                     return {
                         "valid": False, 
-                        "error": f"Duration {duration:.1f}s outside range {duration_range[0]}-{duration_range[1]}s"
+                        "error": f"Duration {duration:.1f}s outside range {min_duration}-{max_duration}s"
                     }
                 
                 return {
                     "valid": True,
                     "duration": duration,
-                    "format": file_path.suffix,
+                    "format": extension,
                     "category": category,
                     "recommendations": [
-                        f"Use volume range: {category_config.get('volume_range', [0.3, 0.7])}",
+                        f"Use volume range: {list(category_config.get('volume_range', _DEFAULT_VOLUME_RANGE))}",
                         f"Usage contexts: {', '.join(category_config.get('usage_contexts', []))}",
                         "Normalize audio but preserve dynamics",
                         "Add appropriate fades as needed"
                     ]
                 }
             else:
-                return {"valid": True, "warning": "Could not analyze audio - pydub not available"}
+                return {"valid": True, "warning": "Could not analyze audio - no audio reader available"}
                 
         except Exception as e:
             return {"valid": False, "error": f"Audio analysis failed: {e}"}
 
 
 # CLI interface
-def main():
-    """Main CLI interface for SFX Library"""
+_QUICK_FLAGS = frozenset({'--create-structure', '--scan-library'})
+
+
+def _quick_command(argv: List[str]) -> Optional[Tuple[set, Optional[str]]]:
+    """(flags, library_path) when argv holds only the structure/scan flags, else None"""
+    flags = set()
+    library_path = None
+    args = iter(argv)
+    for arg in args:
+        if arg in _QUICK_FLAGS:
+            flags.add(arg)
+        elif arg == '--library-path':
+            library_path = next(args, None)
+            if library_path is None or library_path.startswith('-'):
+                return None
+        elif arg.startswith('--library-path='):
+            library_path = arg.split('=', 1)[1]
+        else:
+            return None
+    return (flags, library_path) if flags else None
+
+
+_PARSER = None
+
+
+def _build_parser():
+    """Build the full CLI parser once and keep it for later main() calls"""
+    global _PARSER
     import argparse
     
     parser = argparse.ArgumentParser(description="Sound Effects Library - Professional SFX Management")
@@ -827,6 +1101,28 @@ def main():
     parser.add_argument('--library-path', type=str,
                        help='Path to SFX library')
     
+    _PARSER = parser
+    return parser
+
+
+def main():
+    """Main CLI interface for SFX Library"""
+    import sys
+    
+    # The common maintenance commands dispatch without building the argparse parser
+    quick = _quick_command(sys.argv[1:])
+    if quick:
+        flags, library_path = quick
+        sfx_library = SFXLibrary(library_path)
+        if '--create-structure' in flags:
+            sfx_library.create_library_structure()
+        else:
+            sfx_library._scan_library()
+            print("✓ SFX library scanned and updated")
+        return
+    
+    parser = _PARSER or _build_parser()
+    
     args = parser.parse_args()
     
     sfx_library = SFXLibrary(args.library_path)
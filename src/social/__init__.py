@@ -4,16 +4,35 @@ Kiin Content Factory - Social Media Integration System
 Automated social media posting and management for caregiver content.
 """
 
-from .posting_manager import PostingManager
-from .hashtag_optimizer import HashtagOptimizer
-from .caption_generator import SocialCaptionGenerator
-from .timing_optimizer import TimingOptimizer
-from .repurpose_engine import RepurposeEngine
+import importlib
+
+# Public names and the submodules defining them; imported on first access
+# (PEP 562) so importing one submodule does not pull in every adapter's deps
+_LAZY_IMPORTS = {
+    'PostingManager': '.posting_manager',
+    'HashtagOptimizer': '.hashtag_optimizer',
+    'SocialCaptionGenerator': '.caption_generator',
+    'TimingOptimizer': '.timing_optimizer',
+    'RepurposeEngine': '.repurpose_engine'
+}
 
 __all__ = [
     'PostingManager',
-    'HashtagOptimizer', 
+    'HashtagOptimizer',
     'SocialCaptionGenerator',
     'TimingOptimizer',
     'RepurposeEngine'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
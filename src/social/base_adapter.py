@@ -3,23 +3,41 @@ Base adapter class for social media platforms.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Callable, ClassVar, Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import lru_cache
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
-class PostStatus(Enum):
-    QUEUED = "queued"
-    UPLOADING = "uploading"
-    PROCESSING = "processing"
-    SCHEDULED = "scheduled"
-    PUBLISHED = "published"
-    FAILED = "failed"
-    DELETED = "deleted"
+# Slotted dataclasses where supported; these have field defaults, so
+# __slots__ cannot be declared by hand on Python < 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+class PostStatus(IntEnum):
+    """Post lifecycle state; int-valued so status checks compare as plain ints"""
+    QUEUED = 1
+    UPLOADING = 2
+    PROCESSING = 3
+    SCHEDULED = 4
+    PUBLISHED = 5
+    FAILED = 6
+    DELETED = 7
+    
+    __str__ = Enum.__str__
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name, the form stored in the posting database"""
+        return self.name.lower()
+    
+    @classmethod
+    def from_label(cls, label: str) -> 'PostStatus':
+        return cls[label.upper()]
+
+@dataclass(**_DATACLASS_SLOTS)
 class PostResult:
     """Result of a posting operation"""
     platform: str
@@ -34,7 +52,7 @@ class PostResult:
         if self.metadata is None:
             self.metadata = {}
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VideoContent:
     """Video content data"""
     file_path: str
@@ -50,9 +68,25 @@ class VideoContent:
         if self.mentions is None:
             self.mentions = []
 
+@lru_cache(maxsize=1024)
+def _format_tags(tags: tuple) -> str:
+    """'#tag' list, shared across posts that reuse the same hashtag set"""
+    return ' '.join(f'#{tag}' for tag in tags)
+
+@lru_cache(maxsize=1024)
+def _format_mentions(mentions: tuple) -> str:
+    """'@handle' list, shared across posts that reuse the same mentions"""
+    return ' '.join(f'@{mention}' for mention in mentions)
+
 class BaseSocialAdapter(ABC):
     """Base class for all social media platform adapters"""
     
+    # (check, error) pairs run by validate_content; subclasses may extend the list
+    _VALIDATION_RULES: ClassVar[List[Tuple[Callable[[VideoContent], bool], str]]] = [
+        (lambda content: bool(content.file_path), "Video file path is required"),
+        (lambda content: bool(content.title), "Title is required")
+    ]
+    
     def __init__(self, platform_name: str, credentials: Dict[str, Any]):
         self.platform_name = platform_name
         self.credentials = credentials
@@ -97,28 +131,20 @@ class BaseSocialAdapter(ABC):
     
     def format_hashtags(self, hashtags: List[str]) -> str:
         """Format hashtags for this platform (can be overridden)"""
-        return ' '.join(f'#{tag}' for tag in hashtags)
+        return _format_tags(tuple(hashtags))
     
     def format_mentions(self, mentions: List[str]) -> str:
         """Format mentions for this platform (can be overridden)"""
-        return ' '.join(f'@{mention}' for mention in mentions)
+        return _format_mentions(tuple(mentions))
     
     def validate_content(self, content: VideoContent) -> List[str]:
         """Validate content for this platform (can be overridden)"""
-        errors = []
-        
-        if not content.file_path:
-            errors.append("Video file path is required")
-            
-        if not content.title:
-            errors.append("Title is required")
-            
-        return errors
+        return [error for check, error in self._VALIDATION_RULES if not check(content)]
     
     def log_action(self, action: str, details: Dict[str, Any] = None):
         """Log platform actions for debugging"""
-        details = details or {}
-        logger.info(f"[{self.platform_name}] {action}: {details}")
+        # %-style arguments, so the details dict is only stringified if INFO is enabled
+        logger.info("[%s] %s: %s", self.platform_name, action, details or {})
         
     def handle_rate_limit(self) -> bool:
         """Handle rate limiting (return True if should retry later)"""
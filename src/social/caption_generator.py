@@ -2,117 +2,306 @@
 Social Caption Generator - Platform-specific caption generation and optimization.
 """
 
+import hashlib
 import json
 import re
 import random
 import logging
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Emoji runs, compiled once for removal and counting
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"  # dingbats
+    "\U000024C2-\U0001F251"
+    "]+", flags=re.UNICODE
+)
+
+# Per-platform preferences, built once at import
+_PLATFORM_HOOK_STYLES = MappingProxyType({
+    'instagram': 'question',
+    'tiktok': 'statement',
+    'youtube': 'statement',
+    'twitter': 'question',
+    'linkedin': 'statement',
+    'pinterest': 'statement',
+    'facebook': 'story'
+})
+
+# Index into a CTA type's list that each platform prefers
+_PLATFORM_CTA_INDEX = MappingProxyType({
+    'instagram': 0,
+    'tiktok': 1,
+    'youtube': 2,
+    'twitter': 0,
+    'linkedin': 2,
+    'pinterest': 1,
+    'facebook': 0
+})
+
+# Emoji count each platform tolerates before more are added
+_EMOJI_LIMITS = MappingProxyType({
+    'instagram': 5,  # Can use more emojis
+    'tiktok': 3,     # Moderate emoji use
+    'youtube': 2,    # Conservative
+    'twitter': 2,    # Space is limited
+    'linkedin': 0,   # Professional, no emojis
+    'pinterest': 3,  # Moderate
+    'facebook': 3    # Moderate
+})
+
+# Contraction rewrites for the tone rules, each applied in one regex pass
+_FORMAL_MAP = {"you're": "you are", "don't": "do not", "can't": "cannot"}
+_CASUAL_MAP = {"you are": "you're", "do not": "don't", "cannot": "can't"}
+_FORMAL_RE = re.compile('|'.join(map(re.escape, _FORMAL_MAP)))
+_CASUAL_RE = re.compile('|'.join(map(re.escape, _CASUAL_MAP)))
+
+# Words marking a description sentence as an actionable tip (substring match)
+_SOLUTION_CUE_RE = re.compile('try|do|use|practice', re.IGNORECASE)
+
+def _count_emojis(text: str) -> int:
+    """Number of emoji runs in text, without building the list re.findall would"""
+    if text.isascii():  # Every emoji range lies above ASCII
+        return 0
+    return sum(1 for _ in _EMOJI_RE.finditer(text))
+
+# Built-in templates used when the config file is missing; shared, so treat as read-only
+_DEFAULT_TEMPLATES = {
+    "hooks": {
+        "question": [
+            "Have you ever felt {emotion}?",
+            "What would you tell someone who {situation}?",
+            "Is it just me, or do you also {feeling}?"
+        ],
+        "statement": [
+            "Here's what no one tells you about {topic}:",
+            "The truth about {topic} that caregivers need to hear:",
+            "This changed everything for me as a caregiver:"
+        ],
+        "story": [
+            "Yesterday, something happened that made me realize...",
+            "I used to think {belief}, but then...",
+            "My {relationship} taught me something important:"
+        ]
+    },
+    "body_frameworks": {
+        "tip": {
+            "structure": "Hook + Problem + Solution + Why it works",
+            "templates": [
+                "{hook}\n\nThe challenge: {problem}\n\nWhat helped me: {solution}\n\nWhy this works: {explanation}"
+            ]
+        },
+        "validation": {
+            "structure": "Hook + Feeling + Normalization + Encouragement",
+            "templates": [
+                "{hook}\n\nYou're not alone in feeling {feeling}.\n\nThis is completely normal because {reason}.\n\n{encouragement}"
+            ]
+        },
+        "story": {
+            "structure": "Hook + Situation + Lesson + Application",
+            "templates": [
+                "{hook}\n\n{situation}\n\nWhat I learned: {lesson}\n\nHow this applies to you: {application}"
+            ]
+        }
+    },
+    "call_to_actions": {
+        "share_support": [
+            "Drop a ❤️ if you can relate",
+            "Share your experience in the comments",
+            "Tag someone who needs to hear this"
+        ],
+        "save_share": [
+            "Save this for later",
+            "Share with a fellow caregiver",
+            "Which tip will you try first?"
+        ],
+        "relate": [
+            "Can you relate?",
+            "Have you been there?",
+            "What's your experience with this?"
+        ],
+        "self_reflect": [
+            "What self-care do you need today?",
+            "How will you recharge this week?",
+            "What's one thing you'll do for yourself?"
+        ],
+        "educate_others": [
+            "Share to spread awareness",
+            "Help others understand by sharing",
+            "Let's educate together"
+        ]
+    },
+    "emojis": {
+        "support": ["❤️", "🤗", "💙", "🫂"],
+        "strength": ["💪", "🦋", "🌟", "✨"],
+        "wellness": ["🌱", "🌺", "☀️", "🕊️"],
+        "care": ["💕", "🌸", "🤲", "💝"],
+        "community": ["👥", "🤝", "👋", "💬"]
+    },
+    "tone_adjustments": {
+        "professional": {
+            "remove_emojis": True,
+            "formal_language": True,
+            "avoid_slang": True
+        },
+        "casual": {
+            "use_contractions": True,
+            "conversational": True,
+            "emoji_friendly": True
+        },
+        "inspirational": {
+            "uplifting_words": True,
+            "positive_framing": True,
+            "motivational_ctas": True
+        }
+    }
+}
+
+@lru_cache(maxsize=8)
+def _load_caption_templates(path: str) -> Dict[str, Any]:
+    """Parse the caption templates once per path; the result is shared, so treat it as read-only"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _content_key(content_data: Dict[str, Any]) -> bytes:
+    """Stable fingerprint of a content dict for use as a cache key"""
+    data = json.dumps(content_data, sort_keys=True, default=str).encode('utf-8', 'surrogatepass')
+    return hashlib.blake2b(data, digest_size=16).digest()
+
 class SocialCaptionGenerator:
     """Generate optimized captions for different social media platforms"""
     
+    # Number of seeded generate_caption results kept in memory
+    caption_cache_size = 1024
+    
+    # Platform-specific specs; fixed, so shared by every instance
+    platform_specs = {
+        'instagram': {
+            'max_length': 2200,
+            'optimal_length': 150,
+            'supports_newlines': True,
+            'emoji_friendly': True,
+            'hashtag_style': 'separate_or_integrated',
+            'tone': 'casual_inspirational'
+        },
+        'tiktok': {
+            'max_length': 2200,
+            'optimal_length': 100,
+            'supports_newlines': True,
+            'emoji_friendly': True,
+            'hashtag_style': 'integrated',
+            'tone': 'casual_engaging'
+        },
+        'youtube': {
+            'max_length': 5000,
+            'optimal_length': 200,
+            'supports_newlines': True,
+            'emoji_friendly': False,
+            'hashtag_style': 'description_end',
+            'tone': 'informative'
+        },
+        'twitter': {
+            'max_length': 280,
+            'optimal_length': 120,
+            'supports_newlines': True,
+            'emoji_friendly': True,
+            'hashtag_style': 'integrated',
+            'tone': 'conversational'
+        },
+        'linkedin': {
+            'max_length': 3000,
+            'optimal_length': 300,
+            'supports_newlines': True,
+            'emoji_friendly': False,
+            'hashtag_style': 'minimal',
+            'tone': 'professional'
+        },
+        'pinterest': {
+            'max_length': 500,
+            'optimal_length': 200,
+            'supports_newlines': True,
+            'emoji_friendly': True,
+            'hashtag_style': 'descriptive',
+            'tone': 'helpful'
+        },
+        'facebook': {
+            'max_length': 63206,  # Practically unlimited
+            'optimal_length': 250,
+            'supports_newlines': True,
+            'emoji_friendly': True,
+            'hashtag_style': 'minimal',
+            'tone': 'community_focused'
+        }
+    }
+    
+    # Common caregiver themes and messaging
+    caregiver_themes = {
+        'support': {
+            'keywords': ['support', 'community', 'together', 'help'],
+            'emotional_tone': 'warm',
+            'call_to_action': 'share_support'
+        },
+        'tips': {
+            'keywords': ['tips', 'advice', 'help', 'guide'],
+            'emotional_tone': 'helpful',
+            'call_to_action': 'save_share'
+        },
+        'validation': {
+            'keywords': ['valid', 'normal', 'okay', 'understand'],
+            'emotional_tone': 'reassuring',
+            'call_to_action': 'relate'
+        },
+        'self_care': {
+            'keywords': ['self-care', 'wellness', 'rest', 'recharge'],
+            'emotional_tone': 'nurturing',
+            'call_to_action': 'self_reflect'
+        },
+        'awareness': {
+            'keywords': ['awareness', 'education', 'learn', 'understand'],
+            'emotional_tone': 'informative',
+            'call_to_action': 'educate_others'
+        }
+    }
+    
     def __init__(self, config_path: str = "config/caption_templates.json"):
         self.config_path = config_path
         self.templates = self._load_templates()
         
-        # Platform-specific specs
-        self.platform_specs = {
-            'instagram': {
-                'max_length': 2200,
-                'optimal_length': 150,
-                'supports_newlines': True,
-                'emoji_friendly': True,
-                'hashtag_style': 'separate_or_integrated',
-                'tone': 'casual_inspirational'
-            },
-            'tiktok': {
-                'max_length': 2200,
-                'optimal_length': 100,
-                'supports_newlines': True,
-                'emoji_friendly': True,
-                'hashtag_style': 'integrated',
-                'tone': 'casual_engaging'
-            },
-            'youtube': {
-                'max_length': 5000,
-                'optimal_length': 200,
-                'supports_newlines': True,
-                'emoji_friendly': False,
-                'hashtag_style': 'description_end',
-                'tone': 'informative'
-            },
-            'twitter': {
-                'max_length': 280,
-                'optimal_length': 120,
-                'supports_newlines': True,
-                'emoji_friendly': True,
-                'hashtag_style': 'integrated',
-                'tone': 'conversational'
-            },
-            'linkedin': {
-                'max_length': 3000,
-                'optimal_length': 300,
-                'supports_newlines': True,
-                'emoji_friendly': False,
-                'hashtag_style': 'minimal',
-                'tone': 'professional'
-            },
-            'pinterest': {
-                'max_length': 500,
-                'optimal_length': 200,
-                'supports_newlines': True,
-                'emoji_friendly': True,
-                'hashtag_style': 'descriptive',
-                'tone': 'helpful'
-            },
-            'facebook': {
-                'max_length': 63206,  # Practically unlimited
-                'optimal_length': 250,
-                'supports_newlines': True,
-                'emoji_friendly': True,
-                'hashtag_style': 'minimal',
-                'tone': 'community_focused'
-            }
-        }
+        # LRU cache of seeded captions keyed by (content key, platform, theme, variation, seed)
+        self._caption_cache: "OrderedDict[Tuple, str]" = OrderedDict()
         
-        # Common caregiver themes and messaging
-        self.caregiver_themes = {
-            'support': {
-                'keywords': ['support', 'community', 'together', 'help'],
-                'emotional_tone': 'warm',
-                'call_to_action': 'share_support'
-            },
-            'tips': {
-                'keywords': ['tips', 'advice', 'help', 'guide'],
-                'emotional_tone': 'helpful',
-                'call_to_action': 'save_share'
-            },
-            'validation': {
-                'keywords': ['valid', 'normal', 'okay', 'understand'],
-                'emotional_tone': 'reassuring',
-                'call_to_action': 'relate'
-            },
-            'self_care': {
-                'keywords': ['self-care', 'wellness', 'rest', 'recharge'],
-                'emotional_tone': 'nurturing',
-                'call_to_action': 'self_reflect'
-            },
-            'awareness': {
-                'keywords': ['awareness', 'education', 'learn', 'understand'],
-                'emotional_tone': 'informative',
-                'call_to_action': 'educate_others'
-            }
-        }
+        # Template sections resolved once; the lookups below run per caption
+        self._hooks_by_style = self.templates.get('hooks', {})
+        self._body_frameworks = self.templates.get('body_frameworks', {})
+        self._ctas_by_type = self.templates.get('call_to_actions', {})
+        self._emoji_categories = self.templates.get('emojis', {})
+        self._tone_adjustments = self.templates.get('tone_adjustments', {})
+        
+        # Per-generator RNG for template and variation picks
+        self._rng = random.Random()
+        
+        # Each distinct keyword with every theme it scores for, so _detect_theme
+        # scans for shared keywords ('help', 'understand') only once
+        self._keyword_themes = {}
+        for theme_name, theme_data in self.caregiver_themes.items():
+            for keyword in theme_data['keywords']:
+                self._keyword_themes.setdefault(keyword, []).append(theme_name)
     
     def _load_templates(self) -> Dict[str, Any]:
         """Load caption templates"""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            return _load_caption_templates(self.config_path)
         except FileNotFoundError:
             return self._get_default_templates()
         except Exception as e:
@@ -120,101 +309,43 @@ class SocialCaptionGenerator:
             return self._get_default_templates()
     
     def _get_default_templates(self) -> Dict[str, Any]:
-        """Get default caption templates"""
-        return {
-            "hooks": {
-                "question": [
-                    "Have you ever felt {emotion}?",
-                    "What would you tell someone who {situation}?",
-                    "Is it just me, or do you also {feeling}?"
-                ],
-                "statement": [
-                    "Here's what no one tells you about {topic}:",
-                    "The truth about {topic} that caregivers need to hear:",
-                    "This changed everything for me as a caregiver:"
-                ],
-                "story": [
-                    "Yesterday, something happened that made me realize...",
-                    "I used to think {belief}, but then...",
-                    "My {relationship} taught me something important:"
-                ]
-            },
-            "body_frameworks": {
-                "tip": {
-                    "structure": "Hook + Problem + Solution + Why it works",
-                    "templates": [
-                        "{hook}\n\nThe challenge: {problem}\n\nWhat helped me: {solution}\n\nWhy this works: {explanation}"
-                    ]
-                },
-                "validation": {
-                    "structure": "Hook + Feeling + Normalization + Encouragement",
-                    "templates": [
-                        "{hook}\n\nYou're not alone in feeling {feeling}.\n\nThis is completely normal because {reason}.\n\n{encouragement}"
-                    ]
-                },
-                "story": {
-                    "structure": "Hook + Situation + Lesson + Application",
-                    "templates": [
-                        "{hook}\n\n{situation}\n\nWhat I learned: {lesson}\n\nHow this applies to you: {application}"
-                    ]
-                }
-            },
-            "call_to_actions": {
-                "share_support": [
-                    "Drop a ❤️ if you can relate",
-                    "Share your experience in the comments",
-                    "Tag someone who needs to hear this"
-                ],
-                "save_share": [
-                    "Save this for later",
-                    "Share with a fellow caregiver",
-                    "Which tip will you try first?"
-                ],
-                "relate": [
-                    "Can you relate?",
-                    "Have you been there?",
-                    "What's your experience with this?"
-                ],
-                "self_reflect": [
-                    "What self-care do you need today?",
-                    "How will you recharge this week?",
-                    "What's one thing you'll do for yourself?"
-                ],
-                "educate_others": [
-                    "Share to spread awareness",
-                    "Help others understand by sharing",
-                    "Let's educate together"
-                ]
-            },
-            "emojis": {
-                "support": ["❤️", "🤗", "💙", "🫂"],
-                "strength": ["💪", "🦋", "🌟", "✨"],
-                "wellness": ["🌱", "🌺", "☀️", "🕊️"],
-                "care": ["💕", "🌸", "🤲", "💝"],
-                "community": ["👥", "🤝", "👋", "💬"]
-            },
-            "tone_adjustments": {
-                "professional": {
-                    "remove_emojis": True,
-                    "formal_language": True,
-                    "avoid_slang": True
-                },
-                "casual": {
-                    "use_contractions": True,
-                    "conversational": True,
-                    "emoji_friendly": True
-                },
-                "inspirational": {
-                    "uplifting_words": True,
-                    "positive_framing": True,
-                    "motivational_ctas": True
-                }
-            }
-        }
+        """Get default caption templates (shared, so treat as read-only)"""
+        return _DEFAULT_TEMPLATES
     
     def generate_caption(self, content_data: Dict[str, Any], platform: str, 
-                        theme: Optional[str] = None, variation: str = "A") -> str:
-        """Generate optimized caption for specific platform"""
+                        theme: Optional[str] = None, variation: str = "A",
+                        seed: Optional[int] = None) -> str:
+        """Generate optimized caption for specific platform.
+        
+        With a seed the random picks are reproducible, so the caption is
+        memoized and regenerating the same content is a cache lookup.
+        """
+        if seed is None:
+            return self._build_caption(content_data, platform, theme, variation)
+        
+        cache_key = (_content_key(content_data), platform, theme, variation, seed)
+        cached = self._caption_cache.get(cache_key)
+        if cached is not None:
+            self._caption_cache.move_to_end(cache_key)
+            return cached
+        
+        # Draw this caption's picks from a generator seeded for it alone
+        rng = self._rng
+        self._rng = random.Random(seed)
+        try:
+            caption = self._build_caption(content_data, platform, theme, variation)
+        finally:
+            self._rng = rng
+        
+        self._caption_cache[cache_key] = caption
+        if len(self._caption_cache) > self.caption_cache_size:
+            self._caption_cache.popitem(last=False)
+        
+        return caption
+    
+    def _build_caption(self, content_data: Dict[str, Any], platform: str,
+                       theme: Optional[str], variation: str) -> str:
+        """Run the caption pipeline for one platform and variation"""
         
         # Get platform specifications
         spec = self.platform_specs.get(platform, {})
@@ -249,13 +380,11 @@ class SocialCaptionGenerator:
         """Detect the main theme of content"""
         content_lower = content_text.lower()
         
-        theme_scores = {}
-        for theme_name, theme_data in self.caregiver_themes.items():
-            score = 0
-            for keyword in theme_data['keywords']:
-                if keyword in content_lower:
-                    score += 1
-            theme_scores[theme_name] = score
+        theme_scores = dict.fromkeys(self.caregiver_themes, 0)
+        for keyword, theme_names in self._keyword_themes.items():
+            if keyword in content_lower:
+                for theme_name in theme_names:
+                    theme_scores[theme_name] += 1
         
         # Return theme with highest score, default to 'support'
         if theme_scores:
@@ -288,27 +417,17 @@ class SocialCaptionGenerator:
     
     def _choose_hook_style(self, platform: str) -> str:
         """Choose appropriate hook style for platform"""
-        platform_hook_preferences = {
-            'instagram': 'question',
-            'tiktok': 'statement', 
-            'youtube': 'statement',
-            'twitter': 'question',
-            'linkedin': 'statement',
-            'pinterest': 'statement',
-            'facebook': 'story'
-        }
-        
-        return platform_hook_preferences.get(platform, 'question')
+        return _PLATFORM_HOOK_STYLES.get(platform, 'question')
     
     def _generate_hook(self, content_data: Dict[str, Any], theme: str, style: str) -> str:
         """Generate engaging hook"""
-        hooks = self.templates.get('hooks', {}).get(style, [])
+        hooks = self._hooks_by_style.get(style, [])
         
         if not hooks:
             return content_data.get('title', '')
         
         # Choose random hook template
-        hook_template = random.choice(hooks)
+        hook_template = self._rng.choice(hooks)
         
         # Fill in variables based on content
         variables = self._extract_hook_variables(content_data, theme)
@@ -362,7 +481,7 @@ class SocialCaptionGenerator:
     def _generate_body(self, content_data: Dict[str, Any], theme: str, content_type: str) -> str:
         """Generate the main body content"""
         
-        frameworks = self.templates.get('body_frameworks', {})
+        frameworks = self._body_frameworks
         framework = frameworks.get(content_type, frameworks.get('tip', {}))
         
         templates = framework.get('templates', [])
@@ -370,7 +489,7 @@ class SocialCaptionGenerator:
             return content_data.get('description', '')
         
         # Choose template
-        template = random.choice(templates)
+        template = self._rng.choice(templates)
         
         # Fill in variables
         variables = self._extract_body_variables(content_data, theme)
@@ -399,38 +518,28 @@ class SocialCaptionGenerator:
         
         # Try to extract specific information from description
         if 'tip' in description.lower():
-            # Extract tips if mentioned
-            sentences = description.split('.')
-            for sentence in sentences:
-                if any(word in sentence.lower() for word in ['try', 'do', 'use', 'practice']):
-                    variables['solution'] = sentence.strip()
-                    break
+            # Extract tips if mentioned: the sentence holding the first action cue
+            cue = _SOLUTION_CUE_RE.search(description)
+            if cue:
+                start = description.rfind('.', 0, cue.start()) + 1
+                end = description.find('.', cue.end())
+                variables['solution'] = description[start:end if end != -1 else None].strip()
         
         return variables
     
     def _generate_cta(self, cta_type: str, platform: str) -> str:
         """Generate call-to-action"""
-        ctas = self.templates.get('call_to_actions', {}).get(cta_type, [])
+        ctas = self._ctas_by_type.get(cta_type, [])
         
         if not ctas:
             return ""
         
         # Choose appropriate CTA for platform
-        platform_cta_preferences = {
-            'instagram': 0,  # Index preference for Instagram
-            'tiktok': 1,
-            'youtube': 2,
-            'twitter': 0,
-            'linkedin': 2,
-            'pinterest': 1,
-            'facebook': 0
-        }
-        
-        preferred_index = platform_cta_preferences.get(platform, 0)
+        preferred_index = _PLATFORM_CTA_INDEX.get(platform, 0)
         if preferred_index < len(ctas):
             return ctas[preferred_index]
         else:
-            return random.choice(ctas)
+            return self._rng.choice(ctas)
     
     def _apply_platform_formatting(self, caption: str, platform: str) -> str:
         """Apply platform-specific formatting"""
@@ -450,37 +559,16 @@ class SocialCaptionGenerator:
     
     def _remove_emojis(self, text: str) -> str:
         """Remove emojis from text"""
-        # Simple emoji removal pattern
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map
-            "\U0001F1E0-\U0001F1FF"  # flags
-            "\U00002702-\U000027B0"  # dingbats
-            "\U000024C2-\U0001F251"
-            "]+", flags=re.UNICODE
-        )
-        return emoji_pattern.sub('', text)
+        return _EMOJI_RE.sub('', text)
     
     def _optimize_emojis(self, caption: str, platform: str) -> str:
         """Optimize emoji usage for platform"""
         
         # Platform-specific emoji preferences
-        emoji_limits = {
-            'instagram': 5,  # Can use more emojis
-            'tiktok': 3,     # Moderate emoji use
-            'youtube': 2,    # Conservative
-            'twitter': 2,    # Space is limited
-            'linkedin': 0,   # Professional, no emojis
-            'pinterest': 3,  # Moderate
-            'facebook': 3    # Moderate
-        }
-        
-        limit = emoji_limits.get(platform, 3)
+        limit = _EMOJI_LIMITS.get(platform, 3)
         
         # Count existing emojis
-        emoji_count = len(re.findall(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251]+', caption))
+        emoji_count = _count_emojis(caption)
         
         # Add appropriate emojis if under limit
         if emoji_count < limit:
@@ -492,7 +580,7 @@ class SocialCaptionGenerator:
         """Add relevant emojis to caption"""
         
         # Determine caption theme for emoji selection
-        emoji_categories = self.templates.get('emojis', {})
+        emoji_categories = self._emoji_categories
         
         relevant_emojis = []
         caption_lower = caption.lower()
@@ -514,7 +602,7 @@ class SocialCaptionGenerator:
         added = 0
         if relevant_emojis and added < max_add:
             # Add one emoji at the end
-            caption += f" {random.choice(relevant_emojis)}"
+            caption += f" {self._rng.choice(relevant_emojis)}"
             added += 1
         
         return caption
@@ -522,19 +610,15 @@ class SocialCaptionGenerator:
     def _apply_tone_adjustments(self, caption: str, tone: str) -> str:
         """Apply tone-specific adjustments"""
         
-        tone_rules = self.templates.get('tone_adjustments', {}).get(tone, {})
+        tone_rules = self._tone_adjustments.get(tone, {})
         
         if tone_rules.get('formal_language'):
             # Make language more formal
-            caption = caption.replace("you're", "you are")
-            caption = caption.replace("don't", "do not")
-            caption = caption.replace("can't", "cannot")
+            caption = _FORMAL_RE.sub(lambda match: _FORMAL_MAP[match.group(0)], caption)
         
         if tone_rules.get('use_contractions'):
             # Make language more casual
-            caption = caption.replace("you are", "you're")
-            caption = caption.replace("do not", "don't")
-            caption = caption.replace("cannot", "can't")
+            caption = _CASUAL_RE.sub(lambda match: _CASUAL_MAP[match.group(0)], caption)
         
         if tone_rules.get('remove_emojis'):
             caption = self._remove_emojis(caption)
@@ -563,18 +647,10 @@ class SocialCaptionGenerator:
         if len(text) <= target_length:
             return text
         
-        # Try to end at sentence boundary
-        sentences = text.split('.')
-        truncated = ""
-        
-        for sentence in sentences:
-            if len(truncated + sentence + ".") <= target_length:
-                truncated += sentence + "."
-            else:
-                break
-        
-        if truncated:
-            return truncated.strip()
+        # Try to end at sentence boundary: the longest prefix ending in '.' that fits
+        last_period = text.rfind('.', 0, max(target_length, 0))
+        if last_period != -1:
+            return text[:last_period + 1].strip()
         
         # If no sentence boundaries work, truncate at word boundary
         words = text.split()
@@ -602,7 +678,7 @@ class SocialCaptionGenerator:
                 "Let's talk about something important:",
                 "This might be exactly what you need to hear today:"
             ]
-            lines[0] = random.choice(alternative_hooks)
+            lines[0] = self._rng.choice(alternative_hooks)
             return '\n\n'.join(lines)
         
         # Strategy 2: Different CTA
@@ -615,23 +691,28 @@ class SocialCaptionGenerator:
         
         # Replace last line if it looks like a CTA
         if len(lines) >= 2 and ('?' in lines[-1] or 'share' in lines[-1].lower()):
-            lines[-1] = random.choice(cta_variations)
+            lines[-1] = self._rng.choice(cta_variations)
             return '\n\n'.join(lines)
         
         return original_caption
     
     def generate_ab_test_captions(self, content_data: Dict[str, Any], 
-                                 platform: str, theme: Optional[str] = None) -> Dict[str, str]:
+                                 platform: str, theme: Optional[str] = None,
+                                 seed: Optional[int] = None) -> Dict[str, str]:
         """Generate A/B test caption variations"""
         
-        caption_a = self.generate_caption(content_data, platform, theme, "A")
-        caption_b = self.generate_caption(content_data, platform, theme, "B")
+        # Detect the theme once for both variations and the report
+        if not theme:
+            theme = self._detect_theme(content_data.get('description', ''))
+        
+        caption_a = self.generate_caption(content_data, platform, theme, "A", seed)
+        caption_b = self.generate_caption(content_data, platform, theme, "B", seed)
         
         return {
             "variation_a": caption_a,
             "variation_b": caption_b,
             "platform": platform,
-            "theme": theme or self._detect_theme(content_data.get('description', '')),
+            "theme": theme,
             "character_counts": {
                 "a": len(caption_a),
                 "b": len(caption_b)
@@ -646,7 +727,7 @@ class SocialCaptionGenerator:
             "caption_stats": {
                 "length": len(caption),
                 "word_count": len(caption.split()),
-                "emoji_count": len(re.findall(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251]+', caption)),
+                "emoji_count": _count_emojis(caption),
                 "question_count": caption.count('?'),
                 "exclamation_count": caption.count('!')
             },
@@ -151,6 +151,12 @@ class PostingManager:
         result = None
         if row[8]:
             result_data = json.loads(row[8])
+            status = result_data.get('status')
+            if isinstance(status, str):
+                result_data['status'] = PostStatus.from_label(status)
+            elif status is not None:
+                # Rows saved while results held the integer code
+                result_data['status'] = PostStatus(status)
             result = PostResult(**result_data)
         
         return PostJob(
@@ -158,7 +164,7 @@ class PostingManager:
             platform=row[1],
             content=content,
             scheduled_time=scheduled_time,
-            status=PostStatus(row[4]),
+            status=PostStatus.from_label(row[4]),
             created_at=datetime.fromisoformat(row[5]),
             attempts=row[6],
             max_attempts=row[7],
@@ -170,7 +176,12 @@ class PostingManager:
         with sqlite3.connect(self.db_path) as conn:
             content_json = json.dumps(asdict(job.content))
             scheduled_time_str = job.scheduled_time.isoformat() if job.scheduled_time else None
-            result_json = json.dumps(asdict(job.result)) if job.result else None
+            result_json = None
+            if job.result:
+                # Store the result status as its label, like the status column
+                result_data = asdict(job.result)
+                result_data['status'] = job.result.status.label
+                result_json = json.dumps(result_data)
             
             conn.execute("""
                 INSERT OR REPLACE INTO post_jobs 
@@ -178,7 +189,7 @@ class PostingManager:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 job.id, job.platform, content_json, scheduled_time_str,
-                job.status.value, job.created_at.isoformat(),
+                job.status.label, job.created_at.isoformat(),
                 job.attempts, job.max_attempts, result_json
             ))
     
@@ -235,7 +246,7 @@ class PostingManager:
         """Get current queue status"""
         status_counts = {}
         for status in PostStatus:
-            status_counts[status.value] = len([job for job in self.queue if job.status == status])
+            status_counts[status.label] = len([job for job in self.queue if job.status == status])
         
         return {
             "total_jobs": len(self.queue),
@@ -406,11 +417,14 @@ class PostingManager:
         published_jobs = [job for job in self.queue 
                          if job.status == PostStatus.PUBLISHED and job.result and job.result.post_id]
         
+        # Bind each adapter's handler once rather than per published post
+        analytics_handlers = {platform: adapter.get_analytics for platform, adapter in self.adapters.items()}
+        
         for job in published_jobs:
             try:
-                if job.platform in self.adapters:
-                    adapter = self.adapters[job.platform]
-                    post_analytics = adapter.get_analytics(job.result.post_id)
+                get_analytics = analytics_handlers.get(job.platform)
+                if get_analytics is not None:
+                    post_analytics = get_analytics(job.result.post_id)
                     
                     if job.platform not in analytics:
                         analytics[job.platform] = []
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Check that keyword search accepts ordinary keyword text on both backends
+"""
+
+import os
+import sys
+import tempfile
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from seo.keyword_research import Keyword, KeywordDifficulty, KeywordIntent, KeywordResearcher
+
+TERMS = [
+    "caregiver's guide to respite",
+    "how-to bathe a parent with dementia",
+    "self-care tips for caregivers",
+    'the "sandwich generation" explained',
+    "100% free respite_care options",
+]
+
+# Query -> term it must find
+QUERIES = {
+    "caregiver's": TERMS[0],
+    "how-to": TERMS[1],
+    "self-care tips": TERMS[2],
+    '"sandwich': TERMS[3],
+    "100%": TERMS[4],
+}
+
+
+def _researcher(data_dir: str, fts: bool) -> KeywordResearcher:
+    researcher = KeywordResearcher(data_dir)
+    researcher.fts_available = researcher.fts_available and fts
+    researcher.add_keywords([
+        Keyword(term, 100 * (i + 1), KeywordDifficulty.EASY, KeywordIntent.INFORMATIONAL, "respite")
+        for i, term in enumerate(TERMS)
+    ])
+    return researcher
+
+
+def test_search_keywords_plain_text():
+    """Hyphen, apostrophe and quote queries return matches instead of raising"""
+    for fts in (True, False):
+        with tempfile.TemporaryDirectory() as data_dir:
+            researcher = _researcher(data_dir, fts)
+            try:
+                for query, expected in QUERIES.items():
+                    found = [keyword.term for keyword in researcher.search_keywords(query)]
+                    assert expected in found, f"{query!r} (fts={fts}) found {found}"
+                
+                # A lone quote must not raise
+                researcher.search_keywords('"')
+                
+                if researcher.fts_available:
+                    # FTS5 syntax stays available on request
+                    found = [keyword.term for keyword in researcher.search_keywords("caregiv*", raw=True)]
+                    assert TERMS[0] in found and TERMS[2] in found, found
+                else:
+                    # LIKE wildcards match literally in the fallback
+                    assert [keyword.term for keyword in researcher.search_keywords("_")] == [TERMS[4]]
+            finally:
+                researcher.close()
+
+
+def main():
+    test_search_keywords_plain_text()
+    print("✅ search_keywords handles plain-text queries")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)